@@ -5,17 +5,131 @@ Flask-based web interface with animations and beautiful design
 """
 
 from flask import Flask, render_template, request, jsonify
-from lexer import Lexer, LexerError
+from flask.json.provider import DefaultJSONProvider
+from lexer import Lexer, LexerError, TokenType
 from parser import Parser, ParserError
 from semanticAnalyzer import SemanticAnalyzer, SemanticError
+from functools import lru_cache
+import threading
 import json
 import os
+import orjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json() use it too"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Configure Flask to use the gui folder for templates and static files
 app = Flask(__name__, 
             template_folder='gui',
             static_folder='gui',
             static_url_path='/static')
+app.json = OrjsonProvider(app)
+
+try:
+    # gzip large responses (detailed token lists, parse trees) when flask-compress is installed
+    from flask_compress import Compress
+except ImportError:
+    pass
+else:
+    Compress(app)
+
+# Groups reported by the general tokenize mode, in display order
+TOKEN_GROUPS = ('Keywords', 'Identifiers', 'Literals', 'Operators', 'Delimiters')
+
+# Token type -> group name for the general tokenize mode (unknown types fall back to Delimiters)
+TYPE_TO_GROUP = {
+    **{t: 'Keywords' for t in (
+        TokenType.SELECT, TokenType.FROM, TokenType.WHERE, TokenType.INSERT, TokenType.INTO,
+        TokenType.VALUES, TokenType.UPDATE, TokenType.SET, TokenType.DELETE, TokenType.CREATE,
+        TokenType.TABLE, TokenType.INT, TokenType.FLOAT, TokenType.TEXT, TokenType.AND,
+        TokenType.OR, TokenType.NOT
+    )},
+    TokenType.IDENTIFIER: 'Identifiers',
+    TokenType.NUMBER: 'Literals',
+    TokenType.STRING: 'Literals',
+    **{t: 'Operators' for t in (
+        TokenType.EQUAL, TokenType.NOT_EQUAL, TokenType.LESS_THAN, TokenType.GREATER_THAN,
+        TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL, TokenType.PLUS, TokenType.MINUS,
+        TokenType.MULTIPLY, TokenType.DIVIDE
+    )},
+    **{t: 'Delimiters' for t in (
+        TokenType.LEFT_PAREN, TokenType.RIGHT_PAREN, TokenType.COMMA, TokenType.SEMICOLON
+    )}
+}
+
+# One reusable lexer per server thread
+lexerPool = threading.local()
+
+def getLexer(sourceCode):
+    """Get this thread's pooled lexer, reset to scan sourceCode"""
+    lexer = getattr(lexerPool, 'lexer', None)
+    if lexer is None:
+        lexer = lexerPool.lexer = Lexer(sourceCode)
+    else:
+        lexer.reset(sourceCode)
+    return lexer
+
+def streamTokens(lexer, chunkSize=1024):
+    """Stream the detailed tokenize response in serialized chunks instead of one big body"""
+    count = len(lexer.types) - 1  # The last column entry is always EOF
+    yield b'{"success":true,"mode":"detailed","tokens":['
+    for start in range(0, count, chunkSize):
+        end = min(start + chunkSize, count)
+        chunk = [
+            {'type': tType, 'lexeme': lexeme, 'line': line, 'column': col}
+            for tType, lexeme, line, col in zip(
+                lexer.types[start:end], lexer.lexemes[start:end],
+                lexer.lines[start:end], lexer.cols[start:end]
+            )
+        ]
+        if start:
+            yield b','
+        yield orjson.dumps(chunk)[1:-1]
+    yield b'],"count":%d}' % count
+
+# Cached results pin their tokens and parse tree, so only short sources are cached
+CACHE_MAX_SOURCE_LENGTH = 8 * 1024
+CACHE_MAX_ENTRIES = 32
+
+def tokenizeSource(sourceCode):
+    """Tokenize source code into lexer columns"""
+    lexer = Lexer(sourceCode)
+    lexer.tokenizeColumns()
+    return lexer
+
+def parseSource(sourceCode):
+    """Tokenize and parse source code
+    
+    Returns (lexErrors, parseTree, parseErrors); parsing is skipped when lexing fails.
+    """
+    lexer = getLexer(sourceCode)
+    tokens = lexer.tokenize()
+    lexErrors = lexer.getErrors()
+    if lexErrors:
+        return lexErrors, None, []
+    parser = Parser(tokens, lexer.types)
+    parseTree = parser.parse()
+    return lexErrors, parseTree, parser.getErrors()
+
+memoTokenize = lru_cache(maxsize=CACHE_MAX_ENTRIES)(tokenizeSource)
+memoParse = lru_cache(maxsize=CACHE_MAX_ENTRIES)(parseSource)
+
+def cachedTokenize(sourceCode):
+    """Tokenize source code, memoized on the source text when it is short"""
+    if len(sourceCode) > CACHE_MAX_SOURCE_LENGTH:
+        return tokenizeSource(sourceCode)
+    return memoTokenize(sourceCode)
+
+def cachedParse(sourceCode):
+    """Tokenize and parse source code, memoized on the source text when it is short"""
+    if len(sourceCode) > CACHE_MAX_SOURCE_LENGTH:
+        return parseSource(sourceCode)
+    return memoParse(sourceCode)
 
 @app.route('/')
 def index():
@@ -36,8 +150,7 @@ def tokenize():
             })
         
         try:
-            lexer = Lexer(sourceCode)
-            tokens = lexer.tokenize()
+            lexer = cachedTokenize(sourceCode)
             
             # Check for errors
             errors = lexer.getErrors()
@@ -55,58 +168,21 @@ def tokenize():
                     'errors': errorList
                 })
 
-            # Detailed tokens list
-            detailed = []
-            for token in tokens:
-                if token.tokenType != 'EOF':
-                    detailed.append({
-                        'type': token.tokenType,
-                        'lexeme': token.lexeme,
-                        'line': token.line,
-                        'column': token.col
-                    })
-
             mode = (data.get('mode') or 'detailed').lower()
 
             if mode == 'general':
-                # Grouped analysis per assignment requirements
-                groups = {
-                    'Keywords': {'count': 0, 'examples': []},
-                    'Identifiers': {'count': 0, 'examples': []},
-                    'Literals': {'count': 0, 'examples': []},
-                    'Operators': {'count': 0, 'examples': []},
-                    'Delimiters': {'count': 0, 'examples': []},
-                }
-
-                keywords = {
-                    'SELECT','FROM','WHERE','INSERT','INTO','VALUES','UPDATE','SET','DELETE','CREATE','TABLE','INT','FLOAT','TEXT','AND','OR','NOT'
-                }
-                literals = {'NUMBER','STRING'}
-                operators = {
-                    'EQUAL','NOT_EQUAL','LESS_THAN','GREATER_THAN','LESS_EQUAL','GREATER_EQUAL','PLUS','MINUS','MULTIPLY','DIVIDE'
-                }
-                delims = {'LEFT_PAREN','RIGHT_PAREN','COMMA','SEMICOLON'}
+                # Grouped analysis per assignment requirements, in a single pass over the token columns
+                groups = {name: {'count': 0, 'examples': []} for name in TOKEN_GROUPS}
 
                 total = 0
-                for t in detailed:
-                    tType = t['type']
+                for tType, lexeme in zip(lexer.types, lexer.lexemes):
+                    if tType == TokenType.EOF:
+                        continue
                     total += 1
-                    if tType in keywords:
-                        g = groups['Keywords']
-                    elif tType == 'IDENTIFIER':
-                        g = groups['Identifiers']
-                    elif tType in literals:
-                        g = groups['Literals']
-                    elif tType in operators:
-                        g = groups['Operators']
-                    elif tType in delims:
-                        g = groups['Delimiters']
-                    else:
-                        # Unknowns count under Delimiters fallback
-                        g = groups['Delimiters']
+                    g = groups[TYPE_TO_GROUP.get(tType, 'Delimiters')]
                     g['count'] += 1
                     if len(g['examples']) < 5:
-                        g['examples'].append(t['lexeme'])
+                        g['examples'].append(lexeme)
 
                 return jsonify({
                     'success': True,
@@ -115,12 +191,8 @@ def tokenize():
                     'total': total,
                 })
             else:
-                return jsonify({
-                    'success': True,
-                    'mode': 'detailed',
-                    'tokens': detailed,
-                    'count': len(detailed)
-                })
+                # Detailed tokens list, streamed straight from the lexer's token columns
+                return app.response_class(streamTokens(lexer), mimetype='application/json')
             
         except LexerError as e:
             # This should not happen now, but keep for backward compatibility
@@ -153,12 +225,10 @@ def parse():
             })
         
         try:
-            # First tokenize
-            lexer = Lexer(sourceCode)
-            tokens = lexer.tokenize()
+            # Tokenize and parse (cached on the source text)
+            lexErrors, parseTree, parseErrors = cachedParse(sourceCode)
             
             # Check for lexical errors
-            lexErrors = lexer.getErrors()
             if lexErrors:
                 errorList = []
                 for error in lexErrors:
@@ -173,12 +243,7 @@ def parse():
                     'errors': errorList
                 })
             
-            # Then parse
-            parser = Parser(tokens)
-            parseTree = parser.parse()
-            
             # Check for parsing errors
-            parseErrors = parser.getErrors()
             if parseErrors:
                 errorList = []
                 for error in parseErrors:
@@ -244,12 +309,10 @@ def analyze():
             })
         
         try:
-            # First tokenize
-            lexer = Lexer(sourceCode)
-            tokens = lexer.tokenize()
+            # Tokenize and parse (shared with /parse; the analyzer only reads the tree)
+            lexErrors, parseTree, parseErrors = cachedParse(sourceCode)
             
             # Check for lexical errors
-            lexErrors = lexer.getErrors()
             if lexErrors:
                 errorList = []
                 for error in lexErrors:
@@ -264,12 +327,7 @@ def analyze():
                     'errors': errorList
                 })
             
-            # Then parse
-            parser = Parser(tokens)
-            parseTree = parser.parse()
-            
             # Check for parsing errors
-            parseErrors = parser.getErrors()
             if parseErrors:
                 errorList = []
                 for error in parseErrors:
@@ -332,4 +390,14 @@ if __name__ == '__main__':
     print("🚀 Starting SQL Lexer & Parser GUI...")
     print("📝 Open your browser and navigate to: http://localhost:5001")
     print("✨ Enjoy the modern interface!")
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    if os.environ.get('FLASK_DEBUG') == '1':
+        # Development server with reloader and debugger
+        app.run(debug=True, host='0.0.0.0', port=5001)
+    else:
+        try:
+            # Multi-threaded WSGI server so concurrent submissions are not serialized
+            from waitress import serve
+        except ImportError:
+            app.run(debug=False, host='0.0.0.0', port=5001, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5001, threads=8)
@@ -1,5 +1,12 @@
 #!/usr/bin/env python3
 
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+
 class TokenType:
     """Token types for the SQL-like language"""
     # Keywords
@@ -52,8 +59,94 @@ class TokenType:
     EOF = "EOF"
 
 
+# Master pattern for the common token shapes. Anything it cannot match at the
+# current position (lexical errors, non-ASCII input) is handed to the
+# character-level scanner below so error reporting stays unchanged.
+TOKEN_PATTERN = re.compile(r"""
+      (?P<WHITESPACE>\s+)
+    | (?P<LINE_COMMENT>--[^\n]*)
+    | (?P<BLOCK_COMMENT>\#(?=\#).*?\#\#)
+    | (?P<STRING>'[^'\n]*')
+    | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?)(?![0-9.\x80-\U0010ffff])
+    | (?P<WORD>[A-Za-z][A-Za-z0-9_]*)(?![A-Za-z0-9_\x80-\U0010ffff])
+    | (?P<SYMBOL><=|>=|!=|[=<>+\-*/(),;])
+""", re.VERBOSE | re.DOTALL)
+
+# Keyword lexeme -> token type. Keywords are case-sensitive, so lowercase
+# spellings stay identifiers; the table is built once and shared by all lexers.
+KEYWORDS = {
+    'SELECT': TokenType.SELECT,
+    'FROM': TokenType.FROM,
+    'WHERE': TokenType.WHERE,
+    'INSERT': TokenType.INSERT,
+    'INTO': TokenType.INTO,
+    'VALUES': TokenType.VALUES,
+    'UPDATE': TokenType.UPDATE,
+    'SET': TokenType.SET,
+    'DELETE': TokenType.DELETE,
+    'CREATE': TokenType.CREATE,
+    'TABLE': TokenType.TABLE,
+    'INT': TokenType.INT,
+    'FLOAT': TokenType.FLOAT,
+    'TEXT': TokenType.TEXT,
+    'AND': TokenType.AND,
+    'OR': TokenType.OR,
+    'NOT': TokenType.NOT
+}
+
+
+@lru_cache(maxsize=4096)
+def resolveWord(lexeme):
+    """Resolve a word to its (token type, interned lexeme), cached across lexers"""
+    return KEYWORDS.get(lexeme, TokenType.IDENTIFIER), sys.intern(lexeme)
+
+
+SYMBOL_TOKENS = {
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '=': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL
+}
+
+
+NEWLINE = re.compile(r'\n')
+
+# Character-class runs scanned in C by the regex engine. \w is exactly
+# str.isalnum() or '_'; Unicode digits outside 0-9 are handled in scanDigits.
+IDENTIFIER_RUN = re.compile(r'\w*')
+DIGIT_RUN = re.compile(r'[0-9]*')
+
+# Character class bits for the character-level scanner, precomputed for ASCII
+DIGIT = 1
+ALPHA = 2
+CHAR_CLASS = bytes(
+    (DIGIT if c.isdigit() else 0) | (ALPHA if c.isalpha() else 0)
+    for c in map(chr, range(128))
+)
+
+
+def charClass(char):
+    """Classify a character via the ASCII table, falling back to the str predicates"""
+    code = ord(char)
+    if code < 128:
+        return CHAR_CLASS[code]
+    return (DIGIT if char.isdigit() else 0) | (ALPHA if char.isalpha() else 0)
+
+
 class Token:
     """Represents a token with its type and lexeme"""
+    __slots__ = ('tokenType', 'lexeme', 'line', 'col')
+    
     def __init__(self, tokenType, lexeme, line, col):
         self.tokenType = tokenType
         self.lexeme = lexeme
@@ -77,33 +170,23 @@ class Lexer:
     """Lexical analyzer for SQL-like language"""
     
     def __init__(self, source):
+        self.reset(source)
+    
+    def reset(self, source):
+        """Prepare the lexer to scan new source, so one instance can be reused"""
         self.source = source
         self.currentPos = 0
         self.currentLine = 1
         self.currentCol = 1
+        self.lineStarts = None  # Built on first use by lineIndex()
+        # Fresh containers rather than clear(): callers may still hold the previous results
         self.tokens = []
+        # Token columns (structure of arrays); Token objects are only built by tokenize()
+        self.types = []
+        self.lexemes = []
+        self.lines = array('I')
+        self.cols = array('I')
         self.errors = []  # Collect all errors instead of raising immediately
-        
-        # Keywords
-        self.keywords = {
-            'SELECT': TokenType.SELECT,
-            'FROM': TokenType.FROM,
-            'WHERE': TokenType.WHERE,
-            'INSERT': TokenType.INSERT,
-            'INTO': TokenType.INTO,
-            'VALUES': TokenType.VALUES,
-            'UPDATE': TokenType.UPDATE,
-            'SET': TokenType.SET,
-            'DELETE': TokenType.DELETE,
-            'CREATE': TokenType.CREATE,
-            'TABLE': TokenType.TABLE,
-            'INT': TokenType.INT,
-            'FLOAT': TokenType.FLOAT,
-            'TEXT': TokenType.TEXT,
-            'AND': TokenType.AND,
-            'OR': TokenType.OR,
-            'NOT': TokenType.NOT
-        }
 
     def currentChar(self):
         """Get current character"""
@@ -127,39 +210,116 @@ class Lexer:
             self.currentCol += 1
         self.currentPos += 1
     
-    def skipWhitespace(self):
-        """Skip whitespace characters"""
-        while self.currentChar() and self.currentChar().isspace():
-            self.advance()
+    def lineIndex(self):
+        """Get the offsets at which each source line starts, computed once per source"""
+        if self.lineStarts is None:
+            self.lineStarts = [0] + [m.end() for m in NEWLINE.finditer(self.source)]
+        return self.lineStarts
+    
+    def advanceTo(self, pos):
+        """Advance to an absolute position, updating line and column"""
+        lineStarts = self.lineIndex()
+        line = bisect_right(lineStarts, pos)
+        self.currentLine = line
+        self.currentCol = pos - lineStarts[line - 1] + 1
+        self.currentPos = pos
     
     def tokenize(self):
         """Tokenize the entire source"""
-        while self.currentPos < len(self.source):
-            self.skipWhitespace()
-            if self.currentPos >= len(self.source):
-                break
+        self.tokenizeColumns()
+        self.tokens.extend(map(Token, self.types, self.lexemes, self.lines, self.cols))
+        return self.tokens
+    
+    def tokenizeColumns(self):
+        """Tokenize the entire source into the parallel types/lexemes/lines/cols columns"""
+        source = self.source
+        length = len(source)
+        types = self.types
+        lexemes = self.lexemes
+        lines = self.lines
+        cols = self.cols
+        scan = TOKEN_PATTERN.match
+        intern = sys.intern
+        pos = self.currentPos
+        # Line bookkeeping comes from the line-start index: a match only needs a
+        # lookup when it reaches the start of the next line
+        lineStarts = self.lineIndex()
+        lineCount = len(lineStarts)
+        line = self.currentLine
+        lineStart = lineStarts[line - 1]
+        nextLineStart = lineStarts[line] if line < lineCount else length + 1
+        
+        while pos < length:
+            m = scan(source, pos)
+            if m is None:
+                # Fall back to the character-level scanner for this token
+                self.currentPos = pos
+                self.currentLine = line
+                self.currentCol = pos - lineStart + 1
+                self.scanToken()
+                pos = self.currentPos
+                line = self.currentLine
+                lineStart = lineStarts[line - 1]
+                nextLineStart = lineStarts[line] if line < lineCount else length + 1
+                continue
             
-            try:
-                token = self.nextToken()
-                if token:
-                    self.tokens.append(token)
-            except LexerError as e:
-                # Collect error instead of raising
-                self.errors.append(e)
-                # Error recovery: skip the problematic character and continue
-                if self.currentPos < len(self.source):
-                    self.advance()
+            kind = m.lastgroup
+            end = m.end()
+            if kind == 'WHITESPACE' or kind == 'BLOCK_COMMENT':
+                # Only these can span lines
+                if end >= nextLineStart:
+                    line = bisect_right(lineStarts, end)
+                    lineStart = lineStarts[line - 1]
+                    nextLineStart = lineStarts[line] if line < lineCount else length + 1
+            elif kind != 'LINE_COMMENT':
+                lexeme = m.group()
+                if kind == 'WORD':
+                    # Cached keyword lookup; the lexeme comes back interned
+                    tokenType, lexeme = resolveWord(lexeme)
+                elif kind == 'SYMBOL':
+                    lexeme = intern(lexeme)
+                    tokenType = SYMBOL_TOKENS[lexeme]
+                elif kind == 'NUMBER':
+                    tokenType = TokenType.NUMBER
+                else:
+                    tokenType = TokenType.STRING
+                types.append(tokenType)
+                lexemes.append(lexeme)
+                lines.append(line)
+                cols.append(pos - lineStart + 1)
+            pos = end
+        
+        self.currentPos = pos
+        self.currentLine = line
+        self.currentCol = pos - lineStart + 1
         
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, "", self.currentLine, self.currentCol))
-        return self.tokens
+        types.append(TokenType.EOF)
+        lexemes.append("")
+        lines.append(self.currentLine)
+        cols.append(self.currentCol)
+    
+    def scanToken(self):
+        """Scan a single token character by character, collecting any lexical error"""
+        token, error = self.nextToken()
+        if error:
+            # Collect error instead of raising
+            self.errors.append(error)
+            # Error recovery: skip the problematic character and continue
+            if self.currentPos < len(self.source):
+                self.advance()
+        elif token:
+            self.types.append(token.tokenType)
+            self.lexemes.append(token.lexeme)
+            self.lines.append(token.line)
+            self.cols.append(token.col)
     
     def getErrors(self):
         """Get all collected errors"""
         return self.errors
     
     def nextToken(self):
-        """Get next token"""
+        """Get next token as a (token, error) pair; either may be None"""
         char = self.currentChar()
         startCol = self.currentCol
         
@@ -170,19 +330,21 @@ class Lexer:
         # Single-line comment
         if char == '-' and self.peekChar() == '-':
             self.skipSingleLineComment()
-            return None
+            return None, None
 
         # Multi-line comment
         if char == '#':
             return self.tokenizeMultilineComment()
         
+        charType = charClass(char)
+        
         # Numbers
-        if char.isdigit():
-            return self.tokenizeNumber()
+        if charType & DIGIT:
+            return self.tokenizeNumber(), None
         
         # Identifiers and keywords
-        if char.isalpha():
-            return self.tokenizeIdentifierOrKeyword()
+        if charType & ALPHA:
+            return self.tokenizeIdentifierOrKeyword(), None
         
         # Operators and delimiters
         return self.tokenizeSymbol()
@@ -191,27 +353,31 @@ class Lexer:
         """Tokenize string literal"""
         startLine = self.currentLine
         startCol = self.currentCol
-        lexeme = "'"
-        self.advance()  # Skip opening quote
+        source = self.source
+        length = len(source)
+        start = self.currentPos
+        pos = start + 1  # Skip opening quote
         
-        while self.currentChar():
-            if self.currentChar() == "'":
-                lexeme += "'"
-                self.advance()
-                return Token(TokenType.STRING, lexeme, startLine, startCol)
+        while pos < length:
+            char = source[pos]
+            if char == "'":
+                self.advanceTo(pos + 1)
+                return Token(TokenType.STRING, source[start:pos + 1], startLine, startCol), None
             
-            if self.currentChar() == '\n':
-                raise LexerError("unclosed string", startLine, startCol)
+            if char == '\n':
+                self.advanceTo(pos)
+                return None, LexerError("unclosed string", startLine, startCol)
             
-            lexeme += self.currentChar()
-            self.advance()
+            pos += 1
         
-        raise LexerError("unclosed string", startLine, startCol)
+        self.advanceTo(pos)
+        return None, LexerError("unclosed string", startLine, startCol)
     
     def skipSingleLineComment(self):
         """Skip single-line comment starting with --"""
-        while self.currentChar() and self.currentChar() != '\n':
-            self.advance()
+        source = self.source
+        end = source.find('\n', self.currentPos)
+        self.advanceTo(end if end != -1 else len(source))
     
     def tokenizeMultilineComment(self):
         """Tokenize multi-line comment starting with # (can be # or ##)"""
@@ -222,70 +388,67 @@ class Lexer:
         if self.currentChar() == '#' and self.peekChar() == '#':
             # ## style comment
             self.advance()  # Skip second #
-            self.skipMultilineComment()
-        else:
-            # Single # - treat as invalid according to spec
-            raise LexerError(f"invalid character '#'", startLine, startCol)
+            return None, self.skipMultilineComment()
         
-        return None
+        # Single # - treat as invalid according to spec
+        return None, LexerError(f"invalid character '#'", startLine, startCol)
     
     def skipMultilineComment(self):
-        """Skip multiline comment from ## to ##"""
-        # Look for the closing ##
-        while self.currentChar():
-            if self.currentChar() == '#':
-                self.advance()
-                if self.currentChar() == '#':
-                    # Found closing ##
-                    self.advance()  # Skip closing #
-                    return
-            else:
-                self.advance()
+        """Skip multiline comment from ## to ##, returning an error if it is unclosed"""
+        # Look for the closing ## (the opener's second # may start it)
+        source = self.source
+        end = source.find('##', self.currentPos)
+        if end != -1:
+            self.advanceTo(end + 2)
+            return None
         
-        raise LexerError("unclosed comment", self.currentLine, self.currentCol)
+        self.advanceTo(len(source))
+        return LexerError("unclosed comment", self.currentLine, self.currentCol)
     
     def tokenizeNumber(self):
         """Tokenize numeric literal"""
         startCol = self.currentCol
-        lexeme = ""
+        source = self.source
+        length = len(source)
+        start = pos = self.currentPos
         
         # Integer part
-        while self.currentChar() and self.currentChar().isdigit():
-            lexeme += self.currentChar()
-            self.advance()
+        pos = self.scanDigits(pos)
         
         # Check for decimal point
-        if self.currentChar() == '.':
-            lexeme += '.'
-            self.advance()
-            
-            # Fractional part
-            if self.currentChar() and self.currentChar().isdigit():
-                while self.currentChar() and self.currentChar().isdigit():
-                    lexeme += self.currentChar()
-                    self.advance()
-            else:
-                # Just a dot, could be part of something else
-                # Actually, let's treat it as invalid
-                pass
+        if pos < length and source[pos] == '.':
+            # Fractional part (a trailing dot is kept as part of the number)
+            pos = self.scanDigits(pos + 1)
         
+        lexeme = source[start:pos]
+        self.advanceTo(pos)
         return Token(TokenType.NUMBER, lexeme, self.currentLine, startCol)
     
+    def scanDigits(self, pos):
+        """Return the end of the run of digit characters starting at pos"""
+        source = self.source
+        length = len(source)
+        while True:
+            pos = DIGIT_RUN.match(source, pos).end()
+            if pos < length and source[pos].isdigit():
+                pos += 1
+            else:
+                return pos
+    
     def tokenizeIdentifierOrKeyword(self):
         """Tokenize identifier or keyword"""
         startCol = self.currentCol
-        lexeme = ""
-        
-        while self.currentChar() and (self.currentChar().isalnum() or self.currentChar() == '_'):
-            lexeme += self.currentChar()
-            self.advance()
+        source = self.source
+        start = self.currentPos
+        pos = IDENTIFIER_RUN.match(source, start).end()
+        self.advanceTo(pos)
         
         # Check if it's a keyword
-        tokenType = self.keywords.get(lexeme, TokenType.IDENTIFIER)
+        tokenType, lexeme = resolveWord(source[start:pos])
         return Token(tokenType, lexeme, self.currentLine, startCol)
     
     def tokenizeSymbol(self):
-        """Tokenize operators and delimiters"""
+        """Tokenize operators and delimiters as a (token, error) pair"""
         startCol = self.currentCol
         char = self.currentChar()
         
@@ -303,37 +466,37 @@ class Lexer:
         
         if char in singleCharTokens:
             self.advance()
-            return Token(singleCharTokens[char], char, self.currentLine, startCol)
+            return Token(singleCharTokens[char], char, self.currentLine, startCol), None
         
         # Two character tokens
         if char == '=':
             self.advance()
-            return Token(TokenType.EQUAL, "=", self.currentLine, startCol)
+            return Token(TokenType.EQUAL, "=", self.currentLine, startCol), None
         
         if char == '!':
             self.advance()
             if self.currentChar() == '=':
                 self.advance()
-                return Token(TokenType.NOT_EQUAL, "!=", self.currentLine, startCol)
+                return Token(TokenType.NOT_EQUAL, "!=", self.currentLine, startCol), None
             else:
-                raise LexerError(f"invalid character '{char}'", self.currentLine, startCol)
+                return None, LexerError(f"invalid character '{char}'", self.currentLine, startCol)
         
         if char == '<':
             self.advance()
             if self.currentChar() == '=':
                 self.advance()
-                return Token(TokenType.LESS_EQUAL, "<=", self.currentLine, startCol)
-            return Token(TokenType.LESS_THAN, "<", self.currentLine, startCol)
+                return Token(TokenType.LESS_EQUAL, "<=", self.currentLine, startCol), None
+            return Token(TokenType.LESS_THAN, "<", self.currentLine, startCol), None
         
         if char == '>':
             self.advance()
             if self.currentChar() == '=':
                 self.advance()
-                return Token(TokenType.GREATER_EQUAL, ">=", self.currentLine, startCol)
-            return Token(TokenType.GREATER_THAN, ">", self.currentLine, startCol)
+                return Token(TokenType.GREATER_EQUAL, ">=", self.currentLine, startCol), None
+            return Token(TokenType.GREATER_THAN, ">", self.currentLine, startCol), None
         
         # Unknown character
-        raise LexerError(f"invalid character '{char}'", self.currentLine, startCol)
+        return None, LexerError(f"invalid character '{char}'", self.currentLine, startCol)
 
 
 def main():
@@ -4,173 +4,331 @@ Syntax Analyzer (Parser) for SQL-like language
 Implements Recursive Descent Parsing with Parse Tree generation
 """
 
+import sys
+
 from lexer import Token, TokenType, Lexer
 
 
+class NodeType:
+    """Parse tree node types (string constants, interned by the compiler)"""
+    # Nonterminals
+    QUERY = "Query"
+    CREATE_STMT = "CreateStmt"
+    COLUMN_LIST = "ColumnList"
+    COLUMN_DEF = "ColumnDef"
+    TYPE = "Type"
+    INSERT_STMT = "InsertStmt"
+    VALUE_LIST = "ValueList"
+    VALUE = "Value"
+    SELECT_STMT = "SelectStmt"
+    SELECT_LIST = "SelectList"
+    COLUMN_NAME_LIST = "ColumnNameList"
+    COLUMN_NAME = "ColumnName"
+    WHERE_CLAUSE = "WhereClause"
+    CONDITION = "Condition"
+    SIMPLE_CONDITION = "SimpleCondition"
+    COMPARISON_OP = "ComparisonOp"
+    EXPRESSION = "Expression"
+    TERM = "Term"
+    FACTOR = "Factor"
+    UPDATE_STMT = "UpdateStmt"
+    ASSIGNMENT_LIST = "AssignmentList"
+    ASSIGNMENT = "Assignment"
+    DELETE_STMT = "DeleteStmt"
+    
+    # Terminals (named after the consumed token)
+    CREATE = "CREATE"
+    TABLE = "TABLE"
+    INSERT = "INSERT"
+    INTO = "INTO"
+    VALUES = "VALUES"
+    SELECT = "SELECT"
+    FROM = "FROM"
+    WHERE = "WHERE"
+    UPDATE = "UPDATE"
+    SET = "SET"
+    DELETE = "DELETE"
+    AND = "AND"
+    OR = "OR"
+    NOT = "NOT"
+    IDENTIFIER = "IDENTIFIER"
+    NUMBER = "NUMBER"
+    STRING = "STRING"
+    EQUAL = "EQUAL"
+    PLUS = "PLUS"
+    MINUS = "MINUS"
+    MULTIPLY = "MULTIPLY"
+    DIVIDE = "DIVIDE"
+    LEFT_PAREN = "LEFT_PAREN"
+    RIGHT_PAREN = "RIGHT_PAREN"
+    COMMA = "COMMA"
+
+
+# Shared, immutable child list for terminal nodes, which never get children
+NO_CHILDREN = ()
+
+
 class ParseTreeNode:
     """Base class for all parse tree nodes"""
+    __slots__ = ('nodeType', 'children', 'token', 'childIndex')
+    
     def __init__(self, nodeType, children=None, token=None):
         self.nodeType = nodeType
-        self.children = children if children is not None else []
+        self.childIndex = None  # First child per nodeType, built by findChild()
+        if children is not None:
+            self.children = children
+        else:
+            # Terminals share NO_CHILDREN instead of allocating an empty list each
+            self.children = [] if token is None else NO_CHILDREN
         self.token = token  # Terminal nodes may have associated token
     
     def addChild(self, child):
         """Add a child node"""
         if child is not None:
-            self.children.append(child)
+            if self.children is NO_CHILDREN:
+                self.children = [child]
+            else:
+                self.children.append(child)
+            self.childIndex = None
+    
+    def findChild(self, nodeType):
+        """Get the first child with the given nodeType, or None"""
+        childIndex = self.childIndex
+        if childIndex is None:
+            childIndex = {}
+            for child in self.children:
+                if child and child.nodeType not in childIndex:
+                    childIndex[child.nodeType] = child
+            self.childIndex = childIndex
+        return childIndex.get(nodeType)
     
     def toDict(self):
         """Convert parse tree node to dictionary for JSON serialization"""
-        result = {
-            'nodeType': self.nodeType,
-            'children': [child.toDict() if hasattr(child, 'toDict') else str(child) for child in self.children]
-        }
-        if self.token:
-            result['token'] = {
-                'type': self.token.tokenType,
-                'lexeme': self.token.lexeme,
-                'line': self.token.line,
-                'col': self.token.col
+        # Iterative pre-order walk so deep trees cannot hit the recursion limit;
+        # each dict is appended to its parent's list as it is created
+        root = []
+        stack = [(self, root)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, siblings = pop()
+            if not hasattr(node, 'toDict'):
+                siblings.append(str(node))
+                continue
+            children = []
+            result = {
+                'nodeType': node.nodeType,
+                'children': children
             }
-        return result
+            token = node.token
+            if token:
+                result['token'] = {
+                    'type': token.tokenType,
+                    'lexeme': token.lexeme,
+                    'line': token.line,
+                    'col': token.col
+                }
+            siblings.append(result)
+            for child in reversed(node.children):
+                push((child, children))
+        return root[0]
     
     def __str__(self, level=0):
         """String representation of the parse tree"""
-        indent = "  " * level
-        result = f"{indent}{self.nodeType}"
-        if self.token:
-            result += f" [{self.token.lexeme}]"
-        result += "\n"
-        for child in self.children:
-            result += child.__str__(level + 1)
-        return result
+        parts = []
+        stack = [(self, level)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, depth = pop()
+            parts.append("  " * depth)
+            parts.append(node.nodeType)
+            if node.token:
+                parts.append(f" [{node.token.lexeme}]")
+            parts.append("\n")
+            for child in reversed(node.children):
+                push((child, depth + 1))
+        return "".join(parts)
+
+
+def terminalNode(nodeType, token):
+    """Create a leaf node for a consumed token"""
+    return ParseTreeNode(nodeType, NO_CHILDREN, token)
+
+
+class NullNode(ParseTreeNode):
+    """Shared stand-in node used when the parser only checks syntax"""
+    __slots__ = ()
+    
+    def addChild(self, child):
+        """Discard the child"""
+
+
+NULL_NODE = NullNode("Null", NO_CHILDREN)
+
+
+def nullNode(nodeType, children=None, token=None):
+    """Node factory for syntax-only parsing"""
+    return NULL_NODE
+
+
+def nullTerminal(nodeType, token):
+    """Terminal factory for syntax-only parsing"""
+    return NULL_NODE
 
 
 class ParserError(Exception):
     """Custom exception for syntax errors"""
+    __slots__ = ('message', 'line', 'col', 'expected', 'found')
+    
     def __init__(self, message, line, col, expected=None, found=None):
         self.message = message
         self.line = line
         self.col = col
         self.expected = expected
         self.found = found
-        errorMsg = f"Syntax Error: {message} at line {line}, position {col}"
-        if expected and found:
-            errorMsg += f". Expected '{expected}', but found '{found}'."
-        super().__init__(errorMsg)
+        super().__init__(message)
+    
+    def __str__(self):
+        errorMsg = f"Syntax Error: {self.message} at line {self.line}, position {self.col}"
+        if self.expected and self.found:
+            errorMsg += f". Expected '{self.expected}', but found '{self.found}'."
+        return errorMsg
 
 
 class Parser:
     """Recursive Descent Parser for SQL-like language"""
     
-    def __init__(self, tokens):
+    def __init__(self, tokens, types=None, buildTree=True):
+        # Guarantee a trailing EOF sentinel so token access never runs off the end
+        if not tokens:
+            tokens = [Token(TokenType.EOF, "", 0, 0)]
+        elif tokens[-1].tokenType != TokenType.EOF:
+            last = tokens[-1]
+            tokens = list(tokens)
+            tokens.append(Token(TokenType.EOF, "", last.line, last.col))
         self.tokens = tokens
+        # Token-type column for lookahead and recovery scans; callers holding the
+        # lexer's columns can pass Lexer.types to skip rebuilding it. Entries are
+        # the interned TokenType strings, so they are compared with 'is'
+        if types is None or len(types) != len(tokens):
+            types = [sys.intern(token.tokenType) for token in tokens]
+        self.types = types
         self.currentIndex = 0
         self.errors = []
-        self.syncTokens = {
-            TokenType.SEMICOLON,
-            TokenType.CREATE,
-            TokenType.INSERT,
-            TokenType.SELECT,
-            TokenType.UPDATE,
-            TokenType.DELETE,
-            TokenType.EOF
-        }
+        # With buildTree=False every node is the shared NULL_NODE and only errors are collected
+        if buildTree:
+            self.makeNode = ParseTreeNode
+            self.makeTerminal = terminalNode
+        else:
+            self.makeNode = nullNode
+            self.makeTerminal = nullTerminal
+        self.syncTokens = SYNC_TOKENS
+        self.nextSync = None  # Built on first use by nextSyncIndex()
     
     def currentToken(self):
         """Get current token"""
-        if self.currentIndex >= len(self.tokens):
-            return self.tokens[-1] if self.tokens else None
         return self.tokens[self.currentIndex]
     
     def peekToken(self, offset=1):
         """Peek at token ahead"""
         idx = self.currentIndex + offset
         if idx >= len(self.tokens):
-            return self.tokens[-1] if self.tokens else None
+            return self.tokens[-1]
         return self.tokens[idx]
     
     def advance(self):
-        """Advance to next token"""
-        if self.currentIndex < len(self.tokens):
+        """Advance to next token, stopping at the EOF sentinel"""
+        if self.types[self.currentIndex] is not TokenType.EOF:
             self.currentIndex += 1
     
     def match(self, tokenType):
         """Check if current token matches expected type"""
-        if self.currentToken() and self.currentToken().tokenType == tokenType:
-            return True
-        return False
+        return self.types[self.currentIndex] is tokenType
     
     def consume(self, tokenType, errorMsg=None):
         """Consume token of expected type or raise error"""
-        if self.match(tokenType):
-            token = self.currentToken()
-            self.advance()
-            return token
+        index = self.currentIndex
+        current = self.tokens[index]
+        if self.types[index] is tokenType:
+            if tokenType is not TokenType.EOF:
+                self.currentIndex = index + 1
+            return current
         
         # Error handling
-        current = self.currentToken()
-        if current:
-            expected = errorMsg if errorMsg else tokenType
-            found = current.lexeme if current.lexeme else current.tokenType
-            error = ParserError(
-                errorMsg if errorMsg else f"Expected {tokenType}",
-                current.line,
-                current.col,
-                expected=expected,
-                found=found
-            )
-            self.errors.append(error)
-            raise error
+        error = ParserError(
+            errorMsg if errorMsg else f"Expected {tokenType}",
+            current.line,
+            current.col,
+            expected=errorMsg if errorMsg else tokenType,
+            found=current.lexeme if current.lexeme else current.tokenType
+        )
+        self.errors.append(error)
+        raise error
+    
+    def nextSyncIndex(self, index):
+        """Index of the first synchronizing token at or after index"""
+        nextSync = self.nextSync
+        if nextSync is None:
+            # Built on the first error with one backward scan; EOF always ends it
+            types = self.types
+            syncTokens = self.syncTokens
+            nextSync = [0] * len(types)
+            following = len(types) - 1
+            for i in range(len(types) - 1, -1, -1):
+                if types[i] in syncTokens:
+                    following = i
+                nextSync[i] = following
+            self.nextSync = nextSync
+        return nextSync[index]
+    
+    def errorRecovery(self, error, statementStart=None, aggressive=False):
+        """Panic mode error recovery
+        
+        With aggressive=True (used once errors pile up) the parser first skips to
+        the next semicolon or statement keyword; the return value tells whether
+        that skip reached a statement boundary. statementStart is the index the
+        failed statement began at, which recovery must always move past.
+        """
+        types = self.types
+        index = self.currentIndex
+        resynced = False
+        
+        if aggressive:
+            index = self.nextSyncIndex(index)
+            if types[index] is TokenType.SEMICOLON:
+                index += 1
+                resynced = True
+            elif types[index] in STATEMENT_KEYWORDS:
+                resynced = True
+        
+        if types[index] in self.syncTokens:
+            # If we're already at a sync token (except SEMICOLON), advance past it
+            if types[index] is not TokenType.SEMICOLON and types[index] is not TokenType.EOF:
+                index += 1
         else:
-            error = ParserError(
-                errorMsg if errorMsg else f"Expected {tokenType}",
-                0, 0,
-                expected=errorMsg if errorMsg else tokenType,
-                found="EOF"
-            )
-            self.errors.append(error)
-            raise error
-    
-    def errorRecovery(self, error):
-        """Panic mode error recovery"""
-        # Skip tokens until we find a synchronizing token
-        startIndex = self.currentIndex
+            # Jump to the next synchronizing token: past a semicolon (ready for the
+            # next statement), or onto a statement keyword or EOF
+            index = self.nextSyncIndex(index)
+            if types[index] is TokenType.SEMICOLON:
+                index += 1
         
-        # If we're already at a sync token (except SEMICOLON), advance past it
-        if self.currentToken() and self.currentToken().tokenType in self.syncTokens:
-            if self.currentToken().tokenType != TokenType.SEMICOLON:
-                self.advance()
-            return
+        # A statement that failed on its own leading semicolon must still be skipped
+        if index == statementStart and types[index] is not TokenType.EOF:
+            index += 1
         
-        # Skip tokens until we find a synchronizing token
-        while self.currentToken() and self.currentToken().tokenType != TokenType.EOF:
-            currentType = self.currentToken().tokenType
-            
-            # If we find a semicolon, advance past it and stop (ready for next statement)
-            if currentType == TokenType.SEMICOLON:
-                self.advance()
-                return
-            
-            # If we find a statement keyword, stop here (ready to parse it)
-            if currentType in {TokenType.CREATE, TokenType.INSERT, TokenType.SELECT, 
-                              TokenType.UPDATE, TokenType.DELETE}:
-                return
-            
-            self.advance()
-        
-        # Safety: ensure we always advance at least one token
-        if self.currentIndex == startIndex and self.currentToken():
-            self.advance()
+        self.currentIndex = index
+        return resynced
     
     def parse(self):
         """Parse the entire token stream"""
-        root = ParseTreeNode("Query")
+        root = self.makeNode(NodeType.QUERY)
         maxErrors = 100  # Prevent infinite loops
         errorCount = 0
         consecutiveErrors = 0  # Track consecutive errors to detect stuck state
+        types = self.types
         
-        while self.currentToken() and self.currentToken().tokenType != TokenType.EOF:
+        while types[self.currentIndex] is not TokenType.EOF:
             if errorCount >= maxErrors:
                 # Too many errors, stop parsing
                 break
@@ -187,62 +345,26 @@ class Parser:
                 errorCount += 1
                 consecutiveErrors += 1
                 
-                # If we're stuck (same position after recovery), try harder recovery
-                if consecutiveErrors > 3:
-                    # More aggressive recovery: skip to next semicolon or statement
-                    while self.currentToken() and self.currentToken().tokenType != TokenType.EOF:
-                        if self.currentToken().tokenType == TokenType.SEMICOLON:
-                            self.advance()
-                            consecutiveErrors = 0
-                            break
-                        elif self.currentToken().tokenType in {TokenType.CREATE, TokenType.INSERT, 
-                                                               TokenType.SELECT, TokenType.UPDATE, TokenType.DELETE}:
-                            consecutiveErrors = 0
-                            break
-                        self.advance()
-                
-                self.errorRecovery(e)
-                
-                # Safety check: if we didn't advance, force advance to prevent infinite loop
-                if self.currentIndex == previousIndex and self.currentToken():
-                    self.advance()
-                
-                # Continue parsing after recovery
-                continue
+                # If we're stuck, recover more aggressively
+                if self.errorRecovery(e, previousIndex, consecutiveErrors > 3):
+                    consecutiveErrors = 0
         
         return root
     
     def parseStatement(self):
         """Statement → CreateStmt SEMICOLON | InsertStmt SEMICOLON | SelectStmt SEMICOLON | UpdateStmt SEMICOLON | DeleteStmt SEMICOLON"""
-        stmtNode = None
-        
-        if self.match(TokenType.CREATE):
-            stmtNode = self.parseCreateStatement()
-        elif self.match(TokenType.INSERT):
-            stmtNode = self.parseInsertStatement()
-        elif self.match(TokenType.SELECT):
-            stmtNode = self.parseSelectStatement()
-        elif self.match(TokenType.UPDATE):
-            stmtNode = self.parseUpdateStatement()
-        elif self.match(TokenType.DELETE):
-            stmtNode = self.parseDeleteStatement()
-        else:
-            current = self.currentToken()
-            if current:
-                raise ParserError(
-                    "Expected statement keyword (CREATE, INSERT, SELECT, UPDATE, DELETE)",
-                    current.line,
-                    current.col,
-                    expected="CREATE, INSERT, SELECT, UPDATE, or DELETE",
-                    found=current.lexeme if current.lexeme else current.tokenType
-                )
-            else:
-                raise ParserError(
-                    "Expected statement keyword",
-                    0, 0,
-                    expected="CREATE, INSERT, SELECT, UPDATE, or DELETE",
-                    found="EOF"
-                )
+        current = self.currentToken()
+        parseMethod = STATEMENT_PARSERS.get(current.tokenType)
+        
+        if not parseMethod:
+            raise ParserError(
+                "Expected statement keyword (CREATE, INSERT, SELECT, UPDATE, DELETE)",
+                current.line,
+                current.col,
+                expected="CREATE, INSERT, SELECT, UPDATE, or DELETE",
+                found=current.lexeme if current.lexeme else current.tokenType
+            )
+        stmtNode = parseMethod(self)
         
         # Consume semicolon
         try:
@@ -252,186 +374,101 @@ class Parser:
         
         return stmtNode
     
+    def parseSequence(self, nodeType, production):
+        """Build a node from a fixed production of terminals and sub-rules
+        
+        Terminals are (tokenType, nodeType, errorMsg) tuples and consumed inline;
+        anything else is a Parser method that parses a sub-rule.
+        """
+        children = []
+        append = children.append
+        tokens = self.tokens
+        types = self.types
+        makeTerminal = self.makeTerminal
+        
+        for item in production:
+            if type(item) is tuple:
+                tokenType, leafType, errorMsg = item
+                index = self.currentIndex
+                if types[index] is not tokenType:
+                    self.consume(tokenType, errorMsg)  # Records and raises the error
+                self.currentIndex = index + 1
+                append(makeTerminal(leafType, tokens[index]))
+            else:
+                append(item(self))
+        
+        return self.makeNode(nodeType, children)
+    
     def parseCreateStatement(self):
         """CreateStmt → CREATE TABLE IDENTIFIER LEFT_PAREN ColumnList RIGHT_PAREN"""
-        node = ParseTreeNode("CreateStmt")
-        
-        # CREATE
-        createToken = self.consume(TokenType.CREATE, "Expected 'CREATE'")
-        node.addChild(ParseTreeNode("CREATE", token=createToken))
-        
-        # TABLE
-        tableToken = self.consume(TokenType.TABLE, "Expected 'TABLE'")
-        node.addChild(ParseTreeNode("TABLE", token=tableToken))
-        
-        # IDENTIFIER (table name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected table name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
-        
-        # LEFT_PAREN
-        lparenToken = self.consume(TokenType.LEFT_PAREN, "Expected '('")
-        node.addChild(ParseTreeNode("LEFT_PAREN", token=lparenToken))
-        
-        # ColumnList
-        columnList = self.parseColumnList()
-        node.addChild(columnList)
+        return self.parseSequence(NodeType.CREATE_STMT, CREATE_STMT_RULE)
+    
+    def parseCommaList(self, nodeType, parseItem):
+        """Parse comma-separated items into one node, keeping the COMMA leaves"""
+        children = [parseItem()]
+        append = children.append
         
-        # RIGHT_PAREN
-        rparenToken = self.consume(TokenType.RIGHT_PAREN, "Expected ')'")
-        node.addChild(ParseTreeNode("RIGHT_PAREN", token=rparenToken))
+        current = self.currentToken()
+        while current.tokenType == TokenType.COMMA:
+            self.advance()
+            append(self.makeTerminal(NodeType.COMMA, current))
+            append(parseItem())
+            current = self.currentToken()
         
-        return node
+        return self.makeNode(nodeType, children)
     
     def parseColumnList(self):
         """ColumnList → ColumnDef | ColumnDef COMMA ColumnList"""
-        node = ParseTreeNode("ColumnList")
-        
-        # First column definition
-        columnDef = self.parseColumnDef()
-        node.addChild(columnDef)
-        
-        # More columns (comma-separated)
-        while self.match(TokenType.COMMA):
-            commaToken = self.consume(TokenType.COMMA)
-            node.addChild(ParseTreeNode("COMMA", token=commaToken))
-            columnDef = self.parseColumnDef()
-            node.addChild(columnDef)
-        
-        return node
+        return self.parseCommaList(NodeType.COLUMN_LIST, self.parseColumnDef)
     
     def parseColumnDef(self):
         """ColumnDef → IDENTIFIER Type"""
-        node = ParseTreeNode("ColumnDef")
-        
-        # IDENTIFIER (column name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected column name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
-        
-        # Type
-        typeNode = self.parseType()
-        node.addChild(typeNode)
-        
-        return node
+        return self.parseSequence(NodeType.COLUMN_DEF, COLUMN_DEF_RULE)
     
     def parseType(self):
         """Type → INT | FLOAT | TEXT"""
-        node = ParseTreeNode("Type")
-        
-        if self.match(TokenType.INT):
-            token = self.consume(TokenType.INT, "Expected type (INT, FLOAT, or TEXT)")
-        elif self.match(TokenType.FLOAT):
-            token = self.consume(TokenType.FLOAT, "Expected type (INT, FLOAT, or TEXT)")
-        elif self.match(TokenType.TEXT):
-            token = self.consume(TokenType.TEXT, "Expected type (INT, FLOAT, or TEXT)")
-        else:
-            current = self.currentToken()
-            raise ParserError(
-                "Expected type (INT, FLOAT, or TEXT)",
-                current.line if current else 0,
-                current.col if current else 0,
-                expected="INT, FLOAT, or TEXT",
-                found=current.lexeme if current and current.lexeme else (current.tokenType if current else "EOF")
-            )
+        current = self.currentToken()
+        if current.tokenType in TYPE_TOKENS:
+            self.advance()
+            return self.makeNode(NodeType.TYPE, [self.makeTerminal(current.tokenType, current)])
         
-        node.addChild(ParseTreeNode(token.tokenType, token=token))
-        return node
+        raise ParserError(
+            "Expected type (INT, FLOAT, or TEXT)",
+            current.line,
+            current.col,
+            expected="INT, FLOAT, or TEXT",
+            found=current.lexeme if current.lexeme else current.tokenType
+        )
     
     def parseInsertStatement(self):
         """InsertStmt → INSERT INTO IDENTIFIER VALUES LEFT_PAREN ValueList RIGHT_PAREN"""
-        node = ParseTreeNode("InsertStmt")
-        
-        # INSERT
-        insertToken = self.consume(TokenType.INSERT, "Expected 'INSERT'")
-        node.addChild(ParseTreeNode("INSERT", token=insertToken))
-        
-        # INTO
-        intoToken = self.consume(TokenType.INTO, "Expected 'INTO'")
-        node.addChild(ParseTreeNode("INTO", token=intoToken))
-        
-        # IDENTIFIER (table name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected table name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
-        
-        # VALUES
-        valuesToken = self.consume(TokenType.VALUES, "Expected 'VALUES'")
-        node.addChild(ParseTreeNode("VALUES", token=valuesToken))
-        
-        # LEFT_PAREN
-        lparenToken = self.consume(TokenType.LEFT_PAREN, "Expected '('")
-        node.addChild(ParseTreeNode("LEFT_PAREN", token=lparenToken))
-        
-        # ValueList
-        valueList = self.parseValueList()
-        node.addChild(valueList)
-        
-        # RIGHT_PAREN
-        rparenToken = self.consume(TokenType.RIGHT_PAREN, "Expected ')'")
-        node.addChild(ParseTreeNode("RIGHT_PAREN", token=rparenToken))
-        
-        return node
+        return self.parseSequence(NodeType.INSERT_STMT, INSERT_STMT_RULE)
     
     def parseValueList(self):
         """ValueList → Value | Value COMMA ValueList"""
-        node = ParseTreeNode("ValueList")
-        
-        # First value
-        valueNode = self.parseValue()
-        node.addChild(valueNode)
-        
-        # More values (comma-separated)
-        while self.match(TokenType.COMMA):
-            commaToken = self.consume(TokenType.COMMA)
-            node.addChild(ParseTreeNode("COMMA", token=commaToken))
-            valueNode = self.parseValue()
-            node.addChild(valueNode)
-        
-        return node
+        return self.parseCommaList(NodeType.VALUE_LIST, self.parseValue)
     
     def parseValue(self):
         """Value → NUMBER | STRING | IDENTIFIER"""
-        node = ParseTreeNode("Value")
-        
-        if self.match(TokenType.NUMBER):
-            token = self.consume(TokenType.NUMBER)
-        elif self.match(TokenType.STRING):
-            token = self.consume(TokenType.STRING)
-        elif self.match(TokenType.IDENTIFIER):
-            token = self.consume(TokenType.IDENTIFIER)
-        else:
-            current = self.currentToken()
-            raise ParserError(
-                "Expected value (NUMBER, STRING, or IDENTIFIER)",
-                current.line if current else 0,
-                current.col if current else 0,
-                expected="NUMBER, STRING, or IDENTIFIER",
-                found=current.lexeme if current and current.lexeme else (current.tokenType if current else "EOF")
-            )
+        current = self.currentToken()
+        if current.tokenType in VALUE_TOKENS:
+            self.advance()
+            return self.makeNode(NodeType.VALUE, [self.makeTerminal(current.tokenType, current)])
         
-        node.addChild(ParseTreeNode(token.tokenType, token=token))
-        return node
+        raise ParserError(
+            "Expected value (NUMBER, STRING, or IDENTIFIER)",
+            current.line,
+            current.col,
+            expected="NUMBER, STRING, or IDENTIFIER",
+            found=current.lexeme if current.lexeme else current.tokenType
+        )
     
     def parseSelectStatement(self):
         """SelectStmt → SELECT SelectList FROM IDENTIFIER WhereClause"""
-        node = ParseTreeNode("SelectStmt")
-        
-        # SELECT
-        selectToken = self.consume(TokenType.SELECT, "Expected 'SELECT'")
-        node.addChild(ParseTreeNode("SELECT", token=selectToken))
-        
-        # SelectList
-        selectList = self.parseSelectList()
-        node.addChild(selectList)
-        
-        # FROM
-        fromToken = self.consume(TokenType.FROM, "Expected 'FROM'")
-        node.addChild(ParseTreeNode("FROM", token=fromToken))
-        
-        # IDENTIFIER (table name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected table name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
+        node = self.parseSequence(NodeType.SELECT_STMT, SELECT_STMT_RULE)
         
         # WhereClause (optional)
-        if self.match(TokenType.WHERE):
+        if self.types[self.currentIndex] is TokenType.WHERE:
             whereClause = self.parseWhereClause()
             node.addChild(whereClause)
         
@@ -439,11 +476,12 @@ class Parser:
     
     def parseSelectList(self):
         """SelectList → '*' | ColumnNameList"""
-        node = ParseTreeNode("SelectList")
+        node = self.makeNode(NodeType.SELECT_LIST)
         
-        if self.match(TokenType.MULTIPLY):
-            starToken = self.consume(TokenType.MULTIPLY)
-            node.addChild(ParseTreeNode("MULTIPLY", token=starToken))
+        current = self.currentToken()
+        if current.tokenType == TokenType.MULTIPLY:
+            self.advance()
+            node.addChild(self.makeTerminal(NodeType.MULTIPLY, current))
         else:
             columnNameList = self.parseColumnNameList()
             node.addChild(columnNameList)
@@ -452,249 +490,164 @@ class Parser:
     
     def parseColumnNameList(self):
         """ColumnNameList → ColumnName | ColumnName COMMA ColumnNameList"""
-        node = ParseTreeNode("ColumnNameList")
-        
-        # First column name
-        columnName = self.parseColumnName()
-        node.addChild(columnName)
-        
-        # More column names (comma-separated)
-        while self.match(TokenType.COMMA):
-            commaToken = self.consume(TokenType.COMMA)
-            node.addChild(ParseTreeNode("COMMA", token=commaToken))
-            columnName = self.parseColumnName()
-            node.addChild(columnName)
-        
-        return node
+        return self.parseCommaList(NodeType.COLUMN_NAME_LIST, self.parseColumnName)
     
     def parseColumnName(self):
         """ColumnName → IDENTIFIER | Expression"""
-        node = ParseTreeNode("ColumnName")
+        node = self.makeNode(NodeType.COLUMN_NAME)
         
         # Check if it's an expression (starts with LEFT_PAREN)
-        if self.match(TokenType.LEFT_PAREN):
+        if self.types[self.currentIndex] is TokenType.LEFT_PAREN:
             expr = self.parseExpression()
             node.addChild(expr)
         else:
             idToken = self.consume(TokenType.IDENTIFIER, "Expected column name or expression")
-            node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
+            node.addChild(self.makeTerminal(NodeType.IDENTIFIER, idToken))
         
         return node
     
     def parseWhereClause(self):
         """WhereClause → WHERE Condition"""
-        node = ParseTreeNode("WhereClause")
-        
-        # WHERE
-        whereToken = self.consume(TokenType.WHERE, "Expected 'WHERE'")
-        node.addChild(ParseTreeNode("WHERE", token=whereToken))
-        
-        # Condition
-        condition = self.parseCondition()
-        node.addChild(condition)
-        
-        return node
+        return self.parseSequence(NodeType.WHERE_CLAUSE, WHERE_CLAUSE_RULE)
     
     def parseCondition(self):
         """Condition → SimpleCondition | Condition AND Condition | Condition OR Condition | NOT Condition | LEFT_PAREN Condition RIGHT_PAREN"""
-        node = ParseTreeNode("Condition")
-        
-        # Handle NOT
-        if self.match(TokenType.NOT):
-            notToken = self.consume(TokenType.NOT)
-            node.addChild(ParseTreeNode("NOT", token=notToken))
-            condition = self.parseCondition()
-            node.addChild(condition)
-            return node
-        
-        # Handle parentheses
-        if self.match(TokenType.LEFT_PAREN):
-            lparenToken = self.consume(TokenType.LEFT_PAREN)
-            node.addChild(ParseTreeNode("LEFT_PAREN", token=lparenToken))
-            condition = self.parseCondition()
-            node.addChild(condition)
-            rparenToken = self.consume(TokenType.RIGHT_PAREN, "Expected ')'")
-            node.addChild(ParseTreeNode("RIGHT_PAREN", token=rparenToken))
+        # NOT prefixes and AND/OR chains are right-nested; instead of recursing,
+        # keep the nodes still waiting for their right operand on a stack
+        pending = []
+        while True:
+            node = self.makeNode(NodeType.CONDITION)
+            current = self.currentToken()
             
-            # Check for AND/OR after parentheses
-            if self.match(TokenType.AND) or self.match(TokenType.OR):
-                return self.parseCompoundCondition(node)
-            return node
-        
-        # Parse simple condition
-        simpleCondition = self.parseSimpleCondition()
-        node.addChild(simpleCondition)
-        
-        # Check for AND/OR
-        if self.match(TokenType.AND) or self.match(TokenType.OR):
-            return self.parseCompoundCondition(node)
-        
-        return node
-    
-    def parseCompoundCondition(self, leftCondition):
-        """Parse compound condition with AND/OR"""
-        node = ParseTreeNode("Condition")
-        node.addChild(leftCondition)
-        
-        while self.match(TokenType.AND) or self.match(TokenType.OR):
-            if self.match(TokenType.AND):
-                andToken = self.consume(TokenType.AND)
-                node.addChild(ParseTreeNode("AND", token=andToken))
+            # Handle NOT
+            if current.tokenType == TokenType.NOT:
+                self.advance()
+                node.addChild(self.makeTerminal(NodeType.NOT, current))
+                pending.append(node)
+                continue
+            
+            if current.tokenType == TokenType.LEFT_PAREN:
+                # Handle parentheses
+                self.advance()
+                node.addChild(self.makeTerminal(NodeType.LEFT_PAREN, current))
+                condition = self.parseCondition()
+                node.addChild(condition)
+                rparenToken = self.consume(TokenType.RIGHT_PAREN, "Expected ')'")
+                node.addChild(self.makeTerminal(NodeType.RIGHT_PAREN, rparenToken))
             else:
-                orToken = self.consume(TokenType.OR)
-                node.addChild(ParseTreeNode("OR", token=orToken))
+                # Parse simple condition
+                simpleCondition = self.parseSimpleCondition()
+                node.addChild(simpleCondition)
             
-            # Parse right side
-            rightCondition = self.parseCondition()
-            node.addChild(rightCondition)
+            # Compound condition: wrap the left side and parse the right side next
+            current = self.currentToken()
+            if current.tokenType not in LOGICAL_OPS:
+                break
+            self.advance()
+            compound = self.makeNode(NodeType.CONDITION)
+            compound.addChild(node)
+            compound.addChild(self.makeTerminal(current.tokenType, current))
+            pending.append(compound)
+        
+        # Close the pending nodes from the innermost outwards
+        while pending:
+            parent = pending.pop()
+            parent.addChild(node)
+            node = parent
         
         return node
     
     def parseSimpleCondition(self):
         """SimpleCondition → Expression ComparisonOp Expression"""
-        node = ParseTreeNode("SimpleCondition")
-        
-        # Left expression
-        leftExpr = self.parseExpression()
-        node.addChild(leftExpr)
-        
-        # Comparison operator
-        compOp = self.parseComparisonOp()
-        node.addChild(compOp)
-        
-        # Right expression
-        rightExpr = self.parseExpression()
-        node.addChild(rightExpr)
-        
-        return node
+        return self.parseSequence(NodeType.SIMPLE_CONDITION, SIMPLE_CONDITION_RULE)
     
     def parseComparisonOp(self):
         """ComparisonOp → EQUAL | NOT_EQUAL | LESS_THAN | GREATER_THAN | LESS_EQUAL | GREATER_EQUAL"""
-        node = ParseTreeNode("ComparisonOp")
-        
-        if self.match(TokenType.EQUAL):
-            token = self.consume(TokenType.EQUAL)
-        elif self.match(TokenType.NOT_EQUAL):
-            token = self.consume(TokenType.NOT_EQUAL)
-        elif self.match(TokenType.LESS_THAN):
-            token = self.consume(TokenType.LESS_THAN)
-        elif self.match(TokenType.GREATER_THAN):
-            token = self.consume(TokenType.GREATER_THAN)
-        elif self.match(TokenType.LESS_EQUAL):
-            token = self.consume(TokenType.LESS_EQUAL)
-        elif self.match(TokenType.GREATER_EQUAL):
-            token = self.consume(TokenType.GREATER_EQUAL)
-        else:
-            current = self.currentToken()
-            raise ParserError(
-                "Expected comparison operator (=, !=, <, >, <=, >=)",
-                current.line if current else 0,
-                current.col if current else 0,
-                expected="comparison operator",
-                found=current.lexeme if current and current.lexeme else (current.tokenType if current else "EOF")
-            )
+        current = self.currentToken()
+        if current.tokenType in COMPARISON_OPS:
+            self.advance()
+            return self.makeNode(NodeType.COMPARISON_OP, [self.makeTerminal(current.tokenType, current)])
         
-        node.addChild(ParseTreeNode(token.tokenType, token=token))
-        return node
+        raise ParserError(
+            "Expected comparison operator (=, !=, <, >, <=, >=)",
+            current.line,
+            current.col,
+            expected="comparison operator",
+            found=current.lexeme if current.lexeme else current.tokenType
+        )
     
     def parseExpression(self):
         """Expression → Term | Expression PLUS Term | Expression MINUS Term"""
-        node = ParseTreeNode("Expression")
+        node = self.makeNode(NodeType.EXPRESSION)
         
         # First term
         term = self.parseTerm()
         node.addChild(term)
         
         # More terms with +/- operators
-        while self.match(TokenType.PLUS) or self.match(TokenType.MINUS):
-            if self.match(TokenType.PLUS):
-                plusToken = self.consume(TokenType.PLUS)
-                node.addChild(ParseTreeNode("PLUS", token=plusToken))
-            else:
-                minusToken = self.consume(TokenType.MINUS)
-                node.addChild(ParseTreeNode("MINUS", token=minusToken))
+        current = self.currentToken()
+        while current.tokenType in ADDITIVE_OPS:
+            self.advance()
+            node.addChild(self.makeTerminal(current.tokenType, current))
             
             term = self.parseTerm()
             node.addChild(term)
+            current = self.currentToken()
         
         return node
     
     def parseTerm(self):
         """Term → Factor | Term MULTIPLY Factor | Term DIVIDE Factor"""
-        node = ParseTreeNode("Term")
+        node = self.makeNode(NodeType.TERM)
         
         # First factor
         factor = self.parseFactor()
         node.addChild(factor)
         
         # More factors with */ operators
-        while self.match(TokenType.MULTIPLY) or self.match(TokenType.DIVIDE):
-            if self.match(TokenType.MULTIPLY):
-                multToken = self.consume(TokenType.MULTIPLY)
-                node.addChild(ParseTreeNode("MULTIPLY", token=multToken))
-            else:
-                divToken = self.consume(TokenType.DIVIDE)
-                node.addChild(ParseTreeNode("DIVIDE", token=divToken))
+        current = self.currentToken()
+        while current.tokenType in MULTIPLICATIVE_OPS:
+            self.advance()
+            node.addChild(self.makeTerminal(current.tokenType, current))
             
             factor = self.parseFactor()
             node.addChild(factor)
+            current = self.currentToken()
         
         return node
     
     def parseFactor(self):
         """Factor → NUMBER | STRING | IDENTIFIER | LEFT_PAREN Expression RIGHT_PAREN"""
-        node = ParseTreeNode("Factor")
-        
-        if self.match(TokenType.NUMBER):
-            token = self.consume(TokenType.NUMBER)
-            node.addChild(ParseTreeNode("NUMBER", token=token))
-        elif self.match(TokenType.STRING):
-            token = self.consume(TokenType.STRING)
-            node.addChild(ParseTreeNode("STRING", token=token))
-        elif self.match(TokenType.IDENTIFIER):
-            token = self.consume(TokenType.IDENTIFIER)
-            node.addChild(ParseTreeNode("IDENTIFIER", token=token))
-        elif self.match(TokenType.LEFT_PAREN):
-            lparenToken = self.consume(TokenType.LEFT_PAREN)
-            node.addChild(ParseTreeNode("LEFT_PAREN", token=lparenToken))
+        current = self.currentToken()
+        if current.tokenType in VALUE_TOKENS:
+            # NUMBER, STRING and IDENTIFIER leaves are named after their token type
+            self.advance()
+            return self.makeNode(NodeType.FACTOR, [self.makeTerminal(current.tokenType, current)])
+        
+        if current.tokenType == TokenType.LEFT_PAREN:
+            self.advance()
+            node = self.makeNode(NodeType.FACTOR)
+            node.addChild(self.makeTerminal(NodeType.LEFT_PAREN, current))
             expr = self.parseExpression()
             node.addChild(expr)
             rparenToken = self.consume(TokenType.RIGHT_PAREN, "Expected ')'")
-            node.addChild(ParseTreeNode("RIGHT_PAREN", token=rparenToken))
-        else:
-            current = self.currentToken()
-            raise ParserError(
-                "Expected factor (NUMBER, STRING, IDENTIFIER, or expression)",
-                current.line if current else 0,
-                current.col if current else 0,
-                expected="NUMBER, STRING, IDENTIFIER, or '('",
-                found=current.lexeme if current and current.lexeme else (current.tokenType if current else "EOF")
-            )
+            node.addChild(self.makeTerminal(NodeType.RIGHT_PAREN, rparenToken))
+            return node
         
-        return node
+        raise ParserError(
+            "Expected factor (NUMBER, STRING, IDENTIFIER, or expression)",
+            current.line,
+            current.col,
+            expected="NUMBER, STRING, IDENTIFIER, or '('",
+            found=current.lexeme if current.lexeme else current.tokenType
+        )
     
     def parseUpdateStatement(self):
         """UpdateStmt → UPDATE IDENTIFIER SET AssignmentList WhereClause"""
-        node = ParseTreeNode("UpdateStmt")
-        
-        # UPDATE
-        updateToken = self.consume(TokenType.UPDATE, "Expected 'UPDATE'")
-        node.addChild(ParseTreeNode("UPDATE", token=updateToken))
-        
-        # IDENTIFIER (table name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected table name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
-        
-        # SET
-        setToken = self.consume(TokenType.SET, "Expected 'SET'")
-        node.addChild(ParseTreeNode("SET", token=setToken))
-        
-        # AssignmentList
-        assignmentList = self.parseAssignmentList()
-        node.addChild(assignmentList)
+        node = self.parseSequence(NodeType.UPDATE_STMT, UPDATE_STMT_RULE)
         
         # WhereClause (optional)
-        if self.match(TokenType.WHERE):
+        if self.types[self.currentIndex] is TokenType.WHERE:
             whereClause = self.parseWhereClause()
             node.addChild(whereClause)
         
@@ -702,57 +655,18 @@ class Parser:
     
     def parseAssignmentList(self):
         """AssignmentList → Assignment | Assignment COMMA AssignmentList"""
-        node = ParseTreeNode("AssignmentList")
-        
-        # First assignment
-        assignment = self.parseAssignment()
-        node.addChild(assignment)
-        
-        # More assignments (comma-separated)
-        while self.match(TokenType.COMMA):
-            commaToken = self.consume(TokenType.COMMA)
-            node.addChild(ParseTreeNode("COMMA", token=commaToken))
-            assignment = self.parseAssignment()
-            node.addChild(assignment)
-        
-        return node
+        return self.parseCommaList(NodeType.ASSIGNMENT_LIST, self.parseAssignment)
     
     def parseAssignment(self):
         """Assignment → IDENTIFIER EQUAL Expression"""
-        node = ParseTreeNode("Assignment")
-        
-        # IDENTIFIER (column name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected column name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
-        
-        # EQUAL
-        equalToken = self.consume(TokenType.EQUAL, "Expected '='")
-        node.addChild(ParseTreeNode("EQUAL", token=equalToken))
-        
-        # Expression
-        expr = self.parseExpression()
-        node.addChild(expr)
-        
-        return node
+        return self.parseSequence(NodeType.ASSIGNMENT, ASSIGNMENT_RULE)
     
     def parseDeleteStatement(self):
         """DeleteStmt → DELETE FROM IDENTIFIER WhereClause"""
-        node = ParseTreeNode("DeleteStmt")
-        
-        # DELETE
-        deleteToken = self.consume(TokenType.DELETE, "Expected 'DELETE'")
-        node.addChild(ParseTreeNode("DELETE", token=deleteToken))
-        
-        # FROM
-        fromToken = self.consume(TokenType.FROM, "Expected 'FROM'")
-        node.addChild(ParseTreeNode("FROM", token=fromToken))
-        
-        # IDENTIFIER (table name)
-        idToken = self.consume(TokenType.IDENTIFIER, "Expected table name")
-        node.addChild(ParseTreeNode("IDENTIFIER", token=idToken))
+        node = self.parseSequence(NodeType.DELETE_STMT, DELETE_STMT_RULE)
         
         # WhereClause (optional)
-        if self.match(TokenType.WHERE):
+        if self.types[self.currentIndex] is TokenType.WHERE:
             whereClause = self.parseWhereClause()
             node.addChild(whereClause)
         
@@ -763,15 +677,91 @@ class Parser:
         return self.errors
 
 
+# Single-token dispatch tables for the LL(1) choice points
+STATEMENT_PARSERS = {
+    TokenType.CREATE: Parser.parseCreateStatement,
+    TokenType.INSERT: Parser.parseInsertStatement,
+    TokenType.SELECT: Parser.parseSelectStatement,
+    TokenType.UPDATE: Parser.parseUpdateStatement,
+    TokenType.DELETE: Parser.parseDeleteStatement
+}
+STATEMENT_KEYWORDS = frozenset(STATEMENT_PARSERS)
+LOGICAL_OPS = frozenset({TokenType.AND, TokenType.OR})
+ADDITIVE_OPS = frozenset({TokenType.PLUS, TokenType.MINUS})
+MULTIPLICATIVE_OPS = frozenset({TokenType.MULTIPLY, TokenType.DIVIDE})
+SYNC_TOKENS = STATEMENT_KEYWORDS | {TokenType.SEMICOLON, TokenType.EOF}
+TYPE_TOKENS = frozenset({TokenType.INT, TokenType.FLOAT, TokenType.TEXT})
+VALUE_TOKENS = frozenset({TokenType.NUMBER, TokenType.STRING, TokenType.IDENTIFIER})
+COMPARISON_OPS = frozenset({
+    TokenType.EQUAL, TokenType.NOT_EQUAL, TokenType.LESS_THAN,
+    TokenType.GREATER_THAN, TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL
+})
+
+# Fixed productions driven by Parser.parseSequence: terminals are
+# (tokenType, nodeType, errorMsg), sub-rules are Parser methods
+CREATE_STMT_RULE = (
+    (TokenType.CREATE, NodeType.CREATE, "Expected 'CREATE'"),
+    (TokenType.TABLE, NodeType.TABLE, "Expected 'TABLE'"),
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected table name"),
+    (TokenType.LEFT_PAREN, NodeType.LEFT_PAREN, "Expected '('"),
+    Parser.parseColumnList,
+    (TokenType.RIGHT_PAREN, NodeType.RIGHT_PAREN, "Expected ')'")
+)
+COLUMN_DEF_RULE = (
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected column name"),
+    Parser.parseType
+)
+INSERT_STMT_RULE = (
+    (TokenType.INSERT, NodeType.INSERT, "Expected 'INSERT'"),
+    (TokenType.INTO, NodeType.INTO, "Expected 'INTO'"),
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected table name"),
+    (TokenType.VALUES, NodeType.VALUES, "Expected 'VALUES'"),
+    (TokenType.LEFT_PAREN, NodeType.LEFT_PAREN, "Expected '('"),
+    Parser.parseValueList,
+    (TokenType.RIGHT_PAREN, NodeType.RIGHT_PAREN, "Expected ')'")
+)
+SELECT_STMT_RULE = (
+    (TokenType.SELECT, NodeType.SELECT, "Expected 'SELECT'"),
+    Parser.parseSelectList,
+    (TokenType.FROM, NodeType.FROM, "Expected 'FROM'"),
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected table name")
+)
+WHERE_CLAUSE_RULE = (
+    (TokenType.WHERE, NodeType.WHERE, "Expected 'WHERE'"),
+    Parser.parseCondition
+)
+SIMPLE_CONDITION_RULE = (
+    Parser.parseExpression,
+    Parser.parseComparisonOp,
+    Parser.parseExpression
+)
+UPDATE_STMT_RULE = (
+    (TokenType.UPDATE, NodeType.UPDATE, "Expected 'UPDATE'"),
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected table name"),
+    (TokenType.SET, NodeType.SET, "Expected 'SET'"),
+    Parser.parseAssignmentList
+)
+ASSIGNMENT_RULE = (
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected column name"),
+    (TokenType.EQUAL, NodeType.EQUAL, "Expected '='"),
+    Parser.parseExpression
+)
+DELETE_STMT_RULE = (
+    (TokenType.DELETE, NodeType.DELETE, "Expected 'DELETE'"),
+    (TokenType.FROM, NodeType.FROM, "Expected 'FROM'"),
+    (TokenType.IDENTIFIER, NodeType.IDENTIFIER, "Expected table name")
+)
+
+
 def main():
     """Main function to run the parser"""
-    import sys
-    
-    if len(sys.argv) != 2:
-        print("Usage: python parser.py <input_file>")
+    # --check only validates syntax and skips building the parse tree
+    checkOnly = len(sys.argv) == 3 and sys.argv[1] == "--check"
+    if len(sys.argv) != 2 and not checkOnly:
+        print("Usage: python parser.py [--check] <input_file>")
         sys.exit(1)
     
-    inputFile = sys.argv[1]
+    inputFile = sys.argv[-1]
     
     try:
         with open(inputFile, 'r') as f:
@@ -790,7 +780,7 @@ def main():
             print()
         
         # Parse
-        parser = Parser(tokens)
+        parser = Parser(tokens, lexer.types, buildTree=not checkOnly)
         parseTree = parser.parse()
         
         # Check for parsing errors
@@ -802,7 +792,10 @@ def main():
             print()
         
         # Print parse tree
-        if not parseErrors:
+        if checkOnly:
+            if not parseErrors:
+                print("No syntax errors.")
+        elif not parseErrors:
             print("Parse Tree:")
             print(parseTree)
         else:
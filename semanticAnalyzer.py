@@ -5,20 +5,89 @@ Performs semantic checks on the parse tree from Phase 02
 """
 
 from lexer import TokenType
-from parser import ParseTreeNode
+from parser import ParseTreeNode, VALUE_TOKENS
+
+
+# Token types bound once at module level, so the tree walks skip the TokenType attribute lookup
+INT = TokenType.INT
+FLOAT = TokenType.FLOAT
+TEXT = TokenType.TEXT
+NUMBER = TokenType.NUMBER
+STRING = TokenType.STRING
+IDENTIFIER = TokenType.IDENTIFIER
+
+COLUMN_TYPES = frozenset({INT, FLOAT, TEXT})
+NUMERIC_TYPES = frozenset({INT, FLOAT})
+# (column type, value type) pairs accepted on insertion; INT can be promoted to FLOAT
+INSERT_COMPATIBLE = frozenset({(INT, INT), (FLOAT, INT), (FLOAT, FLOAT), (TEXT, TEXT)})
+# Column type -> literal types it accepts on insertion, derived from INSERT_COMPATIBLE
+ACCEPTED_LITERAL_TYPES = {
+    columnType: frozenset(actual for expected, actual in INSERT_COMPATIBLE if expected == columnType)
+    for columnType in COLUMN_TYPES
+}
+# (left type, right type) pairs that can be compared: any two numerics, or equal types
+COMPARISON_COMPATIBLE = frozenset(
+    {(left, right) for left in NUMERIC_TYPES for right in NUMERIC_TYPES}
+    | {(t, t) for t in COLUMN_TYPES}
+)
+# Statement nodeType -> child index of its target table IDENTIFIER, fixed by the grammar
+# (SELECT SelectList FROM IDENTIFIER, UPDATE IDENTIFIER, DELETE FROM IDENTIFIER, INSERT INTO IDENTIFIER)
+TABLE_NAME_INDEX = {"SelectStmt": 3, "UpdateStmt": 1, "DeleteStmt": 2, "InsertStmt": 2}
+# Statements other than CREATE whose target table scopes identifier annotation
+TABLE_STATEMENTS = frozenset(TABLE_NAME_INDEX)
+
+
+def classifyLiteral(tokenType, lexeme):
+    """Get the data type of a NUMBER or STRING literal, or None for other tokens"""
+    if tokenType == NUMBER:
+        # Check if it's INT or FLOAT ('1' vs '1.5' or the trailing-dot '1.')
+        if '.' in lexeme:
+            return FLOAT
+        return INT
+    elif tokenType == STRING:
+        return TEXT
+    return None
+
+
+def walkTree(node):
+    """Yield node and all its descendants in pre-order, without recursion"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if not node:
+            continue
+        yield node
+        stack.extend(reversed(node.children))
 
 
 class SemanticError(Exception):
     """Custom exception for semantic errors"""
+    __slots__ = ('message', 'line', 'col')
+    
     def __init__(self, message, line, col):
         self.message = message
         self.line = line
         self.col = col
-        super().__init__(f"Semantic Error: {message} at line {line}, position {col}.")
+        super().__init__(message)
+    
+    def __str__(self):
+        return f"Semantic Error: {self.message} at line {self.line}, position {self.col}."
+
+
+class LiteralValue:
+    """A literal taken from an INSERT value list"""
+    __slots__ = ('tokenType', 'lexeme', 'token')
+    
+    def __init__(self, tokenType, lexeme, token):
+        self.tokenType = tokenType
+        self.lexeme = lexeme
+        self.token = token
 
 
 class ColumnInfo:
     """Represents information about a column"""
+    __slots__ = ('name', 'dataType')
+    
     def __init__(self, name, dataType):
         self.name = name
         self.dataType = dataType  # INT, FLOAT, or TEXT
@@ -35,13 +104,31 @@ class ColumnInfo:
 
 class TableInfo:
     """Represents information about a table and its columns"""
+    __slots__ = ('name', 'columns', 'orderedColumns', 'acceptedTypes')
+    
     def __init__(self, name):
         self.name = name
         self.columns = {}  # Dictionary mapping column name to ColumnInfo
+        self.orderedColumns = None  # Declaration-order tuple, built by getOrderedColumns()
+        self.acceptedTypes = None  # Per-column accepted literal types, built by getAcceptedTypes()
     
     def addColumn(self, columnInfo):
         """Add a column to the table"""
         self.columns[columnInfo.name] = columnInfo
+        self.orderedColumns = None
+        self.acceptedTypes = None
+    
+    def getOrderedColumns(self):
+        """Get the columns as a tuple in declaration order"""
+        if self.orderedColumns is None:
+            self.orderedColumns = tuple(self.columns.values())
+        return self.orderedColumns
+    
+    def getAcceptedTypes(self):
+        """Get the literal types each column accepts on insertion, in declaration order"""
+        if self.acceptedTypes is None:
+            self.acceptedTypes = tuple(ACCEPTED_LITERAL_TYPES[col.dataType] for col in self.getOrderedColumns())
+        return self.acceptedTypes
     
     def getColumn(self, columnName):
         """Get column information by name"""
@@ -69,6 +156,10 @@ class SymbolTable:
             raise ValueError(f"Table '{tableInfo.name}' already exists")
         self.tables[tableInfo.name] = tableInfo
     
+    def trySetTable(self, tableInfo):
+        """Add a table unless one with the same name exists; return whether it was added"""
+        return self.tables.setdefault(tableInfo.name, tableInfo) is tableInfo
+    
     def getTable(self, tableName):
         """Get table information by name"""
         return self.tables.get(tableName)
@@ -101,26 +192,28 @@ class SemanticAnalyzer:
         self.symbolTable = SymbolTable()
         self.errors = []
         self.annotatedTree = None
+        self.annotationPending = False  # Set by analyze(); the tree is built by getAnnotatedTree()
+        # Identifier -> (TableInfo, ColumnInfo) or None for annotation outside a statement's
+        # table; filled by annotateTree once the symbol table is complete
+        self.unscopedColumns = {}
     
     def analyze(self):
-        """Perform semantic analysis on the parse tree"""
-        try:
-            # First pass: process CREATE TABLE statements to build symbol table
-            self.buildSymbolTable()
-            
-            # Second pass: validate all statements
-            self.validateStatements()
-            
-            # Third pass: annotate parse tree with semantic information
-            self.annotatedTree = self.annotateTree(self.parseTree)
-            
-            return len(self.errors) == 0
-        except Exception as e:
-            self.errors.append(SemanticError(
-                f"Unexpected error during semantic analysis: {str(e)}",
-                0, 0
-            ))
-            return False
+        """Perform semantic analysis on the parse tree
+        
+        Problems in the query are collected in self.errors rather than raised;
+        an exception here means a bug in the analyzer itself.
+        """
+        # First pass: process CREATE TABLE statements to build symbol table
+        self.buildSymbolTable()
+        
+        # Second pass: validate each statement
+        self.validateStatements()
+        
+        # The annotated tree is only needed for display, so build it on first request
+        self.annotatedTree = None
+        self.annotationPending = True
+        
+        return len(self.errors) == 0
     
     def buildSymbolTable(self):
         """First pass: build symbol table from CREATE TABLE statements"""
@@ -135,20 +228,17 @@ class SemanticAnalyzer:
         """Process CREATE TABLE statement to add to symbol table"""
         # Structure: CREATE TABLE IDENTIFIER LEFT_PAREN ColumnList RIGHT_PAREN
         # Children: [CREATE, TABLE, IDENTIFIER, LEFT_PAREN, ColumnList, RIGHT_PAREN]
+        children = node.children
         tableNameNode = None
-        columnListNode = None
         
         # Find table name (should be the IDENTIFIER at index 2, after CREATE and TABLE)
-        if len(node.children) > 2:
-            child = node.children[2]
+        if len(children) > 2:
+            child = children[2]
             if child and child.nodeType == "IDENTIFIER" and child.token:
                 tableNameNode = child
         
         # Find ColumnList (should be at index 4, after CREATE, TABLE, IDENTIFIER, LEFT_PAREN)
-        for child in node.children:
-            if child and child.nodeType == "ColumnList":
-                columnListNode = child
-                break
+        columnListNode = node.findChild("ColumnList")
         
         if not tableNameNode or not tableNameNode.token:
             self.errors.append(SemanticError(
@@ -159,8 +249,9 @@ class SemanticAnalyzer:
         
         tableName = tableNameNode.token.lexeme
         
-        # Check for redeclaration
-        if self.symbolTable.hasTable(tableName):
+        # Register the table, detecting redeclaration with the same probe
+        tableInfo = TableInfo(tableName)
+        if not self.symbolTable.trySetTable(tableInfo):
             self.errors.append(SemanticError(
                 f"Table '{tableName}' is already declared",
                 tableNameNode.token.line,
@@ -168,23 +259,9 @@ class SemanticAnalyzer:
             ))
             return
         
-        # Create table info
-        tableInfo = TableInfo(tableName)
-        
         # Extract column definitions
         if columnListNode:
             self.extractColumns(columnListNode, tableInfo, tableNameNode.token.line)
-        
-        # Add table to symbol table
-        try:
-            self.symbolTable.addTable(tableInfo)
-        except ValueError as e:
-            # Should not happen due to check above, but handle just in case
-            self.errors.append(SemanticError(
-                str(e),
-                tableNameNode.token.line,
-                tableNameNode.token.col
-            ))
     
     def extractColumns(self, columnListNode, tableInfo, defaultLine):
         """Extract column definitions from ColumnList node"""
@@ -192,28 +269,25 @@ class SemanticAnalyzer:
             if child and child.nodeType == "ColumnDef":
                 columnName = None
                 columnType = None
+                colToken = None
                 
-                # Extract column name and type
+                # Extract column name and type, keeping the name token for error positions
                 for colChild in child.children:
                     if colChild and colChild.nodeType == "IDENTIFIER" and colChild.token:
-                        columnName = colChild.token.lexeme
+                        colToken = colChild.token
+                        columnName = colToken.lexeme
                     elif colChild and colChild.nodeType == "Type":
                         # Extract type from Type node
                         for typeChild in colChild.children:
                             if typeChild and typeChild.token:
                                 typeTokenType = typeChild.token.tokenType
-                                if typeTokenType in [TokenType.INT, TokenType.FLOAT, TokenType.TEXT]:
+                                if typeTokenType in COLUMN_TYPES:
                                     columnType = typeTokenType
                                     break
                 
                 if columnName and columnType:
                     # Validate type
-                    if columnType not in [TokenType.INT, TokenType.FLOAT, TokenType.TEXT]:
-                        colToken = None
-                        for colChild in child.children:
-                            if colChild and colChild.nodeType == "IDENTIFIER" and colChild.token:
-                                colToken = colChild.token
-                                break
+                    if columnType not in COLUMN_TYPES:
                         self.errors.append(SemanticError(
                             f"Invalid data type '{columnType}' for column '{columnName}'. Expected INT, FLOAT, or TEXT",
                             colToken.line if colToken else defaultLine,
@@ -224,11 +298,6 @@ class SemanticAnalyzer:
                         tableInfo.addColumn(columnInfo)
                 else:
                     # Missing column name or type
-                    colToken = None
-                    for colChild in child.children:
-                        if colChild and colChild.nodeType == "IDENTIFIER" and colChild.token:
-                            colToken = colChild.token
-                            break
                     self.errors.append(SemanticError(
                         "Missing column name or type in column definition",
                         colToken.line if colToken else defaultLine,
@@ -240,40 +309,30 @@ class SemanticAnalyzer:
         if not self.parseTree or self.parseTree.nodeType != "Query":
             return
         
+        # CreateStmt has no entry: it was already processed in buildSymbolTable
         for child in self.parseTree.children:
             if not child:
                 continue
             
-            if child.nodeType == "CreateStmt":
-                # Already processed in buildSymbolTable, but check for redeclaration again
-                pass
-            elif child.nodeType == "InsertStmt":
-                self.validateInsertStatement(child)
-            elif child.nodeType == "SelectStmt":
-                self.validateSelectStatement(child)
-            elif child.nodeType == "UpdateStmt":
-                self.validateUpdateStatement(child)
-            elif child.nodeType == "DeleteStmt":
-                self.validateDeleteStatement(child)
+            validator = STATEMENT_VALIDATORS.get(child.nodeType)
+            if validator:
+                validator(self, child)
     
     def validateInsertStatement(self, node):
         """Validate INSERT INTO statement"""
         # Structure: INSERT INTO IDENTIFIER VALUES LEFT_PAREN ValueList RIGHT_PAREN
         # Children: [INSERT, INTO, IDENTIFIER, VALUES, LEFT_PAREN, ValueList, RIGHT_PAREN]
+        children = node.children
         tableNameNode = None
-        valueListNode = None
         
         # Find table name (should be the IDENTIFIER at index 2, after INSERT and INTO)
-        if len(node.children) > 2:
-            child = node.children[2]
+        if len(children) > 2:
+            child = children[2]
             if child and child.nodeType == "IDENTIFIER" and child.token:
                 tableNameNode = child
         
         # Find ValueList
-        for child in node.children:
-            if child and child.nodeType == "ValueList":
-                valueListNode = child
-                break
+        valueListNode = node.findChild("ValueList")
         
         if not tableNameNode or not tableNameNode.token:
             return
@@ -297,7 +356,8 @@ class SemanticAnalyzer:
             values = self.extractValues(valueListNode)
         
         # Check number of values matches number of columns
-        expectedCount = len(tableInfo.columns)
+        columnList = tableInfo.getOrderedColumns()
+        expectedCount = len(columnList)
         actualCount = len(values)
         
         if actualCount != expectedCount:
@@ -315,19 +375,15 @@ class SemanticAnalyzer:
             return
         
         # Check type consistency
-        columnList = list(tableInfo.columns.values())
-        for i, value in enumerate(values):
-            if i < len(columnList):
-                columnInfo = columnList[i]
-                valueType = self.getLiteralType(value)
-                
-                if not self.isTypeCompatible(columnInfo.dataType, valueType):
-                    valueToken = value.get('token') if isinstance(value, dict) else None
-                    self.errors.append(SemanticError(
-                        f"Type mismatch: Column '{columnInfo.name}' is defined as {columnInfo.dataType}, but a {valueType} literal was provided for insertion",
-                        valueToken['line'] if valueToken and isinstance(valueToken, dict) else (valueToken.line if valueToken else tableNameNode.token.line),
-                        valueToken['col'] if valueToken and isinstance(valueToken, dict) else (valueToken.col if valueToken else tableNameNode.token.col)
-                    ))
+        for columnInfo, value, acceptedTypes in zip(columnList, values, tableInfo.getAcceptedTypes()):
+            valueType = self.getLiteralType(value)
+            
+            if valueType not in acceptedTypes:
+                self.errors.append(SemanticError(
+                    f"Type mismatch: Column '{columnInfo.name}' is defined as {columnInfo.dataType}, but a {valueType} literal was provided for insertion",
+                    value.token.line,
+                    value.token.col
+                ))
     
     def extractValues(self, valueListNode):
         """Extract values from ValueList node"""
@@ -338,70 +394,42 @@ class SemanticAnalyzer:
                 for valueChild in child.children:
                     if valueChild and valueChild.token:
                         tokenType = valueChild.token.tokenType
-                        if tokenType in [TokenType.NUMBER, TokenType.STRING, TokenType.IDENTIFIER]:
-                            values.append({
-                                'type': tokenType,
-                                'lexeme': valueChild.token.lexeme,
-                                'token': valueChild.token
-                            })
+                        if tokenType in VALUE_TOKENS:
+                            values.append(LiteralValue(tokenType, valueChild.token.lexeme, valueChild.token))
                             break
             # Skip COMMA nodes
         return values
     
     def getLiteralType(self, value):
         """Get the data type of a literal value"""
-        if isinstance(value, dict):
-            tokenType = value.get('type')
-            if tokenType == TokenType.NUMBER:
-                # Check if it's INT or FLOAT
-                lexeme = value.get('lexeme', '')
-                if '.' in lexeme:
-                    return TokenType.FLOAT
-                else:
-                    return TokenType.INT
-            elif tokenType == TokenType.STRING:
-                return TokenType.TEXT
-        return None
-    
-    def isTypeCompatible(self, expectedType, actualType):
-        """Check if actual type is compatible with expected type"""
-        if expectedType == TokenType.INT:
-            return actualType == TokenType.INT
-        elif expectedType == TokenType.FLOAT:
-            return actualType in [TokenType.INT, TokenType.FLOAT]  # INT can be promoted to FLOAT
-        elif expectedType == TokenType.TEXT:
-            return actualType == TokenType.TEXT
-        return False
+        return classifyLiteral(value.tokenType, value.lexeme)
     
     def validateSelectStatement(self, node):
         """Validate SELECT statement"""
         # Structure: SELECT SelectList FROM IDENTIFIER WhereClause
         # Children: [SELECT, SelectList, FROM, IDENTIFIER, WhereClause?]
+        children = node.children
         tableNameNode = None
         selectListNode = None
-        whereClauseNode = None
         
         # Find SelectList (should be at index 1, after SELECT)
-        if len(node.children) > 1:
-            child = node.children[1]
+        if len(children) > 1:
+            child = children[1]
             if child and child.nodeType == "SelectList":
                 selectListNode = child
         
         # Find table name (should be the IDENTIFIER after FROM)
-        for i, child in enumerate(node.children):
+        for i, child in enumerate(children):
             if child and child.nodeType == "FROM":
                 # Next child should be IDENTIFIER (table name)
-                if i + 1 < len(node.children):
-                    nextChild = node.children[i + 1]
+                if i + 1 < len(children):
+                    nextChild = children[i + 1]
                     if nextChild and nextChild.nodeType == "IDENTIFIER" and nextChild.token:
                         tableNameNode = nextChild
                 break
         
         # Find WhereClause (optional)
-        for child in node.children:
-            if child and child.nodeType == "WhereClause":
-                whereClauseNode = child
-                break
+        whereClauseNode = node.findChild("WhereClause")
         
         if not tableNameNode or not tableNameNode.token:
             return
@@ -421,19 +449,11 @@ class SemanticAnalyzer:
         
         # Validate column names in SELECT list (if not *)
         if selectListNode:
-            isStar = False
-            for child in selectListNode.children:
-                if child and child.nodeType == "MULTIPLY":
-                    isStar = True
-                    break
+            isStar = selectListNode.findChild("MULTIPLY") is not None
             
             if not isStar:
                 # Validate column names
-                columnNameList = None
-                for child in selectListNode.children:
-                    if child and child.nodeType == "ColumnNameList":
-                        columnNameList = child
-                        break
+                columnNameList = selectListNode.findChild("ColumnNameList")
                 
                 if columnNameList:
                     self.validateColumnNames(columnNameList, tableInfo, tableName)
@@ -446,31 +466,28 @@ class SemanticAnalyzer:
         """Validate UPDATE statement"""
         # Structure: UPDATE IDENTIFIER SET AssignmentList WhereClause
         # Children: [UPDATE, IDENTIFIER, SET, AssignmentList, WhereClause?]
+        children = node.children
         tableNameNode = None
         assignmentListNode = None
-        whereClauseNode = None
         
         # Find table name (should be the IDENTIFIER at index 1, after UPDATE)
-        if len(node.children) > 1:
-            child = node.children[1]
+        if len(children) > 1:
+            child = children[1]
             if child and child.nodeType == "IDENTIFIER" and child.token:
                 tableNameNode = child
         
         # Find AssignmentList (should be after SET)
-        for i, child in enumerate(node.children):
+        for i, child in enumerate(children):
             if child and child.nodeType == "SET":
                 # Next child should be AssignmentList
-                if i + 1 < len(node.children):
-                    nextChild = node.children[i + 1]
+                if i + 1 < len(children):
+                    nextChild = children[i + 1]
                     if nextChild and nextChild.nodeType == "AssignmentList":
                         assignmentListNode = nextChild
                 break
         
         # Find WhereClause (optional)
-        for child in node.children:
-            if child and child.nodeType == "WhereClause":
-                whereClauseNode = child
-                break
+        whereClauseNode = node.findChild("WhereClause")
         
         if not tableNameNode or not tableNameNode.token:
             return
@@ -512,20 +529,17 @@ class SemanticAnalyzer:
         """Validate DELETE statement"""
         # Structure: DELETE FROM IDENTIFIER WhereClause
         # Children: [DELETE, FROM, IDENTIFIER, WhereClause?]
+        children = node.children
         tableNameNode = None
-        whereClauseNode = None
         
         # Find table name (should be the IDENTIFIER at index 2, after DELETE and FROM)
-        if len(node.children) > 2:
-            child = node.children[2]
+        if len(children) > 2:
+            child = children[2]
             if child and child.nodeType == "IDENTIFIER" and child.token:
                 tableNameNode = child
         
         # Find WhereClause (optional)
-        for child in node.children:
-            if child and child.nodeType == "WhereClause":
-                whereClauseNode = child
-                break
+        whereClauseNode = node.findChild("WhereClause")
         
         if not tableNameNode or not tableNameNode.token:
             return
@@ -564,7 +578,7 @@ class SemanticAnalyzer:
                                 colChild.token.line,
                                 colChild.token.col
                             ))
-                        else:
+                        elif len(involvedTables) > 1:
                             # Check for ambiguity across multiple tables
                             self.checkColumnAmbiguity(columnName, involvedTables, colChild.token)
                         break
@@ -572,11 +586,7 @@ class SemanticAnalyzer:
     def validateWhereClause(self, whereClauseNode, tableInfo, tableName):
         """Validate WHERE clause"""
         # Find Condition node
-        conditionNode = None
-        for child in whereClauseNode.children:
-            if child and child.nodeType == "Condition":
-                conditionNode = child
-                break
+        conditionNode = whereClauseNode.findChild("Condition")
         
         if conditionNode:
             # Track tables involved for ambiguity checking
@@ -614,9 +624,10 @@ class SemanticAnalyzer:
             leftExpr = expressions[0]
             rightExpr = expressions[1]
             
-            # Check for ambiguous column names in expressions
-            self.checkExpressionForAmbiguity(leftExpr, involvedTables)
-            self.checkExpressionForAmbiguity(rightExpr, involvedTables)
+            # Check for ambiguous column names in expressions (only possible across tables)
+            if len(involvedTables) > 1:
+                self.checkExpressionForAmbiguity(leftExpr, involvedTables)
+                self.checkExpressionForAmbiguity(rightExpr, involvedTables)
             
             # Check type compatibility
             leftType = self.getExpressionType(leftExpr, tableInfo, tableName)
@@ -684,178 +695,159 @@ class SemanticAnalyzer:
         if not exprNode or len(involvedTables) <= 1:
             return
         
-        # Recursively search for identifier tokens (column names)
-        for child in exprNode.children:
-            if child and child.nodeType == "Term":
-                for termChild in child.children:
-                    if termChild and termChild.nodeType == "Factor":
-                        for factorChild in termChild.children:
-                            if factorChild and factorChild.token:
-                                tokenType = factorChild.token.tokenType
-                                if tokenType == TokenType.IDENTIFIER:
-                                    # Check if this identifier is a column name
-                                    columnName = factorChild.token.lexeme
-                                    self.checkColumnAmbiguity(columnName, involvedTables, factorChild.token)
+        # Every identifier token in the expression is a column reference
+        for node in walkTree(exprNode):
+            token = node.token
+            if token and token.tokenType == IDENTIFIER:
+                self.checkColumnAmbiguity(token.lexeme, involvedTables, token)
     
     def getFirstTokenFromExpression(self, exprNode):
         """Get the first token from an expression node"""
         if not exprNode:
             return None
         
-        # Recursively search for first token
-        for child in exprNode.children:
-            if child and child.token:
-                return child.token
-            # Recursively search in child
-            token = self.getFirstTokenFromExpression(child)
-            if token:
-                return token
+        for node in walkTree(exprNode):
+            if node.token:
+                return node.token
         return None
     
     def getExpressionType(self, exprNode, tableInfo, tableName):
         """Get the data type of an expression"""
         # For now, handle simple cases: NUMBER, STRING, IDENTIFIER
-        for child in exprNode.children:
+        # Fast path: the leading Term -> Factor -> leaf, which the grammar fixes at index 0
+        children = exprNode.children
+        if children and children[0] and children[0].nodeType == "Term" and children[0].children:
+            factor = children[0].children[0]
+            if factor and factor.nodeType == "Factor":
+                leaf = factor.children[0] if factor.children else None
+                if leaf and leaf.token and leaf.token.tokenType in VALUE_TOKENS:
+                    return self.getLeafType(leaf.token, tableInfo)
+        
+        # Otherwise scan on to the first factor that is a literal or column
+        for child in children:
             if child and child.nodeType == "Term":
                 for termChild in child.children:
                     if termChild and termChild.nodeType == "Factor":
                         for factorChild in termChild.children:
-                            if factorChild and factorChild.token:
-                                tokenType = factorChild.token.tokenType
-                                if tokenType == TokenType.NUMBER:
-                                    # Check if INT or FLOAT
-                                    lexeme = factorChild.token.lexeme
-                                    if '.' in lexeme:
-                                        return TokenType.FLOAT
-                                    else:
-                                        return TokenType.INT
-                                elif tokenType == TokenType.STRING:
-                                    return TokenType.TEXT
-                                elif tokenType == TokenType.IDENTIFIER:
-                                    # Look up column type
-                                    columnName = factorChild.token.lexeme
-                                    columnInfo = tableInfo.getColumn(columnName)
-                                    if columnInfo:
-                                        return columnInfo.dataType
-                                    else:
-                                        # Column doesn't exist - error already reported
-                                        return None
+                            if factorChild and factorChild.token and factorChild.token.tokenType in VALUE_TOKENS:
+                                return self.getLeafType(factorChild.token, tableInfo)
         return None
     
+    def getLeafType(self, token, tableInfo):
+        """Get the data type of a NUMBER, STRING or IDENTIFIER leaf token"""
+        if token.tokenType == IDENTIFIER:
+            # Look up column type
+            columnInfo = tableInfo.getColumn(token.lexeme)
+            if columnInfo:
+                return columnInfo.dataType
+            # Column doesn't exist - error already reported
+            return None
+        return classifyLiteral(token.tokenType, token.lexeme)
+    
     def isTypeCompatibleForComparison(self, leftType, rightType):
         """Check if two types are compatible for comparison"""
-        # Numeric types can be compared
-        if leftType in [TokenType.INT, TokenType.FLOAT] and rightType in [TokenType.INT, TokenType.FLOAT]:
-            return True
-        # Same types are compatible
-        if leftType == rightType:
-            return True
-        return False
+        return (leftType, rightType) in COMPARISON_COMPATIBLE
     
     def annotateTree(self, node, context=None):
         """Annotate parse tree with semantic information"""
         if not node:
             return None
         
-        # Create annotated node
-        annotated = {
-            'nodeType': node.nodeType,
-            'children': [],
-            'semanticInfo': {}
-        }
-        
-        # Update context based on node type
-        newContext = context
-        if node.nodeType == "CreateStmt":
-            # Extract table name for context
-            if len(node.children) > 2:
-                tableNameNode = node.children[2]
-                if tableNameNode and tableNameNode.nodeType == "IDENTIFIER" and tableNameNode.token:
-                    newContext = {'table': tableNameNode.token.lexeme}
-        elif node.nodeType in ["SelectStmt", "UpdateStmt", "DeleteStmt", "InsertStmt"]:
-            # Extract table name for context
-            tableName = self.getTableNameFromStatement(node)
-            if tableName:
-                newContext = {'table': tableName}
-        
-        # Add token information
-        if node.token:
-            annotated['token'] = {
-                'type': node.token.tokenType,
-                'lexeme': node.token.lexeme,
-                'line': node.token.line,
-                'col': node.token.col
+        root = None
+        # Explicit work stack of (node, parent's annotated children, inherited context)
+        stack = [(node, None, context)]
+        while stack:
+            node, siblings, context = stack.pop()
+            
+            # Create annotated node
+            annotated = {
+                'nodeType': node.nodeType,
+                'children': [],
+                'semanticInfo': {}
             }
             
-            # Annotate with data type for literals and identifiers
-            if node.token.tokenType == TokenType.NUMBER:
-                if '.' in node.token.lexeme:
-                    annotated['semanticInfo']['dataType'] = TokenType.FLOAT
-                else:
-                    annotated['semanticInfo']['dataType'] = TokenType.INT
-            elif node.token.tokenType == TokenType.STRING:
-                annotated['semanticInfo']['dataType'] = TokenType.TEXT
-            elif node.token.tokenType == TokenType.IDENTIFIER:
-                # Try to find column info using context
-                identifierName = node.token.lexeme
-                if newContext and 'table' in newContext:
-                    tableInfo = self.symbolTable.getTable(newContext['table'])
-                    if tableInfo:
-                        columnInfo = tableInfo.getColumn(identifierName)
-                        if columnInfo:
-                            annotated['semanticInfo']['dataType'] = columnInfo.dataType
-                            annotated['semanticInfo']['symbolTableRef'] = {
-                                'table': tableInfo.name,
-                                'column': columnInfo.name
-                            }
-                else:
-                    # Try all tables (for ambiguous cases)
-                    for tableInfo in self.symbolTable.tables.values():
-                        columnInfo = tableInfo.getColumn(identifierName)
-                        if columnInfo:
-                            annotated['semanticInfo']['dataType'] = columnInfo.dataType
-                            annotated['semanticInfo']['symbolTableRef'] = {
-                                'table': tableInfo.name,
-                                'column': columnInfo.name
-                            }
-                            break
-        
-        # Recursively annotate children with context
-        for child in node.children:
-            annotatedChild = self.annotateTree(child, newContext)
-            if annotatedChild:
-                annotated['children'].append(annotatedChild)
+            # Update context based on node type
+            newContext = context
+            if node.nodeType == "CreateStmt":
+                # Extract table name for context
+                if len(node.children) > 2:
+                    tableNameNode = node.children[2]
+                    if tableNameNode and tableNameNode.nodeType == "IDENTIFIER" and tableNameNode.token:
+                        newContext = {'table': tableNameNode.token.lexeme}
+            elif node.nodeType in TABLE_STATEMENTS:
+                # Extract table name for context
+                tableName = self.getTableNameFromStatement(node)
+                if tableName:
+                    newContext = {'table': tableName}
+            
+            # Add token information
+            token = node.token
+            if token:
+                tokenType = token.tokenType
+                annotated['token'] = {
+                    'type': tokenType,
+                    'lexeme': token.lexeme,
+                    'line': token.line,
+                    'col': token.col
+                }
+            
+                # Annotate with data type for literals and identifiers; keywords and
+                # punctuation, most of the tokens, skip the branches with one set probe
+                if tokenType in VALUE_TOKENS:
+                    if tokenType == IDENTIFIER:
+                        # Try to find column info using context
+                        identifierName = token.lexeme
+                        if newContext and 'table' in newContext:
+                            tableInfo = self.symbolTable.getTable(newContext['table'])
+                            if tableInfo:
+                                columnInfo = tableInfo.getColumn(identifierName)
+                                if columnInfo:
+                                    annotated['semanticInfo']['dataType'] = columnInfo.dataType
+                                    annotated['semanticInfo']['symbolTableRef'] = {
+                                        'table': tableInfo.name,
+                                        'column': columnInfo.name
+                                    }
+                        else:
+                            # Try all tables (for ambiguous cases), once per identifier
+                            if identifierName in self.unscopedColumns:
+                                owner = self.unscopedColumns[identifierName]
+                            else:
+                                owner = None
+                                for tableInfo in self.symbolTable.tables.values():
+                                    columnInfo = tableInfo.getColumn(identifierName)
+                                    if columnInfo:
+                                        owner = (tableInfo, columnInfo)
+                                        break
+                                self.unscopedColumns[identifierName] = owner
+                            if owner:
+                                tableInfo, columnInfo = owner
+                                annotated['semanticInfo']['dataType'] = columnInfo.dataType
+                                annotated['semanticInfo']['symbolTableRef'] = {
+                                    'table': tableInfo.name,
+                                    'column': columnInfo.name
+                                }
+                    else:
+                        annotated['semanticInfo']['dataType'] = classifyLiteral(tokenType, token.lexeme)
+            
+            if siblings is None:
+                root = annotated
+            else:
+                siblings.append(annotated)
+            
+            # Push children in reverse so they are annotated, and appended, in order
+            for child in reversed(node.children):
+                if child:
+                    stack.append((child, annotated['children'], newContext))
         
-        return annotated
+        return root
     
     def getTableNameFromStatement(self, node):
         """Extract table name from a statement node"""
-        if node.nodeType == "SelectStmt":
-            # Find IDENTIFIER after FROM
-            for i, child in enumerate(node.children):
-                if child and child.nodeType == "FROM":
-                    if i + 1 < len(node.children):
-                        nextChild = node.children[i + 1]
-                        if nextChild and nextChild.nodeType == "IDENTIFIER" and nextChild.token:
-                            return nextChild.token.lexeme
-        elif node.nodeType == "UpdateStmt":
-            # IDENTIFIER at index 1
-            if len(node.children) > 1:
-                child = node.children[1]
-                if child and child.nodeType == "IDENTIFIER" and child.token:
-                    return child.token.lexeme
-        elif node.nodeType == "DeleteStmt":
-            # IDENTIFIER at index 2
-            if len(node.children) > 2:
-                child = node.children[2]
-                if child and child.nodeType == "IDENTIFIER" and child.token:
-                    return child.token.lexeme
-        elif node.nodeType == "InsertStmt":
-            # IDENTIFIER at index 2
-            if len(node.children) > 2:
-                child = node.children[2]
-                if child and child.nodeType == "IDENTIFIER" and child.token:
-                    return child.token.lexeme
+        index = TABLE_NAME_INDEX.get(node.nodeType)
+        if index is not None and len(node.children) > index:
+            child = node.children[index]
+            if child and child.nodeType == "IDENTIFIER" and child.token:
+                return child.token.lexeme
         return None
     
     def getErrors(self):
@@ -867,6 +859,17 @@ class SemanticAnalyzer:
         return self.symbolTable
     
     def getAnnotatedTree(self):
-        """Get annotated parse tree"""
+        """Get annotated parse tree, annotating it on the first call after analyze()"""
+        if self.annotationPending:
+            self.annotatedTree = self.annotateTree(self.parseTree)
+            self.annotationPending = False
         return self.annotatedTree
 
+
+# Per-statement validation, dispatched on the statement's nodeType
+STATEMENT_VALIDATORS = {
+    "InsertStmt": SemanticAnalyzer.validateInsertStatement,
+    "SelectStmt": SemanticAnalyzer.validateSelectStatement,
+    "UpdateStmt": SemanticAnalyzer.validateUpdateStatement,
+    "DeleteStmt": SemanticAnalyzer.validateDeleteStatement
+}
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Optional build of the lexer, parser and semantic analyzer as C extensions with Cython
+
+    python setup.py build_ext --inplace
+
+lexer.py, parser.py and semanticAnalyzer.py are compiled as-is (pure Python
+mode), so the plain modules keep working whenever the extensions have not
+been built.
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+extensions = [
+    Extension("lexer", ["lexer.py"], extra_compile_args=["-O3"]),
+    Extension("parser", ["parser.py"], extra_compile_args=["-O3"]),
+    Extension("semanticAnalyzer", ["semanticAnalyzer.py"], extra_compile_args=["-O3"])
+]
+
+setup(
+    name="miniSQLCompiler",
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={'language_level': 3}
+    )
+)